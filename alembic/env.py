@@ -23,10 +23,10 @@ if config.config_file_name is not None:
 # target_metadata = None
 
 from src.database.base import Base
-from src.config import settings
+from src.config import get_settings
 
 target_metadata = Base.metadata
-sqlalchemy_url = settings.database_settings.database_url
+sqlalchemy_url = get_settings().database_settings.database_url
 config.set_main_option("sqlalchemy.url", sqlalchemy_url)
 
 # other values from the config, defined by the needs of env.py,
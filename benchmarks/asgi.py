@@ -0,0 +1,43 @@
+import asyncio
+import json
+from typing import Any, Dict, Tuple
+
+from starlette.types import ASGIApp
+
+
+async def asgi_request(
+        app: ASGIApp, method: str, path: str, body: Any = None
+) -> Tuple[int, Dict[str, str], bytes]:
+    """Drive an ASGI app in-process without a server or HTTP client."""
+    raw_body = json.dumps(body).encode("utf-8") if body is not None else b""
+    headers = [(b"content-type", b"application/json")] if body is not None else []
+    path, _, query = path.partition("?")
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+        "method": method, "scheme": "http", "path": path, "raw_path": path.encode(),
+        "query_string": query.encode(), "root_path": "", "headers": headers,
+        "client": ("127.0.0.1", 1234), "server": ("testserver", 80),
+    }
+    received = False
+    completed = asyncio.Event()
+    response: Dict[str, Any] = {"body": b""}
+
+    async def receive():
+        nonlocal received
+        if received:  # like a real client, only disconnect once the response is complete
+            await completed.wait()
+            return {"type": "http.disconnect"}
+        received = True
+        return {"type": "http.request", "body": raw_body, "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            response["status"] = message["status"]
+            response["headers"] = {key.decode(): value.decode() for key, value in message["headers"]}
+        elif message["type"] == "http.response.body":
+            response["body"] += message.get("body", b"")
+            if not message.get("more_body", False):
+                completed.set()
+
+    await app(scope, receive, send)
+    return response["status"], response["headers"], response["body"]
@@ -0,0 +1,35 @@
+"""Hashes/sec per bcrypt cost factor on this host.
+
+Usage: python -m benchmarks.bcrypt_cost [--min-rounds 10] [--max-rounds 14] [--seconds 2]
+"""
+import argparse
+import time
+
+from src.api.auth.utils.password_hasher.bcrypt_password_hasher import BcryptPasswordHasher
+
+
+def measure(rounds: int, seconds: float) -> float:
+    hasher = BcryptPasswordHasher(rounds=rounds)
+    hashes = 0
+    started = time.perf_counter()
+    while hashes == 0 or time.perf_counter() - started < seconds:
+        hasher.hash_password("benchmark-password")
+        hashes += 1
+    return hashes / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--min-rounds", type=int, default=10)
+    parser.add_argument("--max-rounds", type=int, default=14)
+    parser.add_argument("--seconds", type=float, default=2.0)
+    args = parser.parse_args()
+
+    print(f"{'rounds':>6} {'hashes/sec':>12} {'ms/hash':>10}")
+    for rounds in range(args.min_rounds, args.max_rounds + 1):
+        rate = measure(rounds, args.seconds)
+        print(f"{rounds:>6} {rate:>12.2f} {1000 / rate:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Items/sec through Celery tasks, one task per item vs TaskBatcher batches.
+
+Runs with task_always_eager and an in-memory broker, so no Redis is needed;
+the numbers show task + session overhead per item, not broker latency.
+
+Usage: CELERY_BROKER_URL=memory:// CELERY_BACKEND_URL=cache+memory:// CELERY_APP_NAME=bench \
+       python -m benchmarks.celery_batching [--items 2000] [--batch-size 200]
+"""
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.suites.repository import BenchmarkPersonModel
+from src.celery_app import celery_app
+from src.database.base_repository import BaseRepository
+from src.database.database import DatabaseHelper
+from src.tasks.database_task import DatabaseTask
+from src.tasks.task_batcher import TaskBatcher
+
+
+@celery_app.task(base=DatabaseTask, bind=True)
+def create_benchmark_people(self, rows: list) -> None:
+    self.run_in_session(lambda session: BaseRepository(session, BenchmarkPersonModel).bulk_create(rows))
+
+
+def measure_single(items: int) -> float:
+    started = time.perf_counter()
+    for index in range(items):
+        create_benchmark_people.delay([{"name": f"single-{index}", "age": index % 100}])
+    return items / (time.perf_counter() - started)
+
+
+def measure_batched(items: int, batch_size: int) -> float:
+    batcher = TaskBatcher(create_benchmark_people, max_size=batch_size, max_delay=60)
+    started = time.perf_counter()
+    for index in range(items):
+        batcher.add({"name": f"batched-{index}", "age": index % 100})
+    batcher.flush()
+    return items / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=2000)
+    parser.add_argument("--batch-size", type=int, default=200)
+    args = parser.parse_args()
+
+    celery_app.conf.task_always_eager = True
+    with tempfile.TemporaryDirectory() as directory:
+        DatabaseTask.use_database_helper(
+            DatabaseHelper(url=f"sqlite+aiosqlite:///{Path(directory) / 'tasks.db'}", echo=False, profile="tests")
+        )
+
+        async def create_table():
+            async with create_benchmark_people.database_helper.engine.begin() as conn:
+                await conn.run_sync(BenchmarkPersonModel.__table__.create)
+
+        create_benchmark_people.run_async(create_table())
+        try:
+            single = measure_single(args.items)
+            batched = measure_batched(args.items, args.batch_size)
+        finally:
+            DatabaseTask.shutdown()
+
+    print(f"{'mode':<16} {'items/sec':>12}")
+    print(f"{'task per item':<16} {single:>12.1f}")
+    print(f"{'batched':<16} {batched:>12.1f} ({batched / single:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+import inspect
+import json
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+
+class BenchmarkRunner:
+    """Times sync or async callables in rounds and keeps per-call statistics by name."""
+
+    def __init__(self, rounds: int = 5, scale: float = 1.0):
+        self.rounds = rounds
+        self.scale = scale  # e.g. 0.1 for a quick smoke run
+        self.results: Dict[str, Dict[str, Any]] = {}
+
+    async def measure(self, name: str, func: Callable[[], Any], iterations: int = 100) -> Dict[str, Any]:
+        iterations = max(1, int(iterations * self.scale))
+
+        await self._call(func)  # warm-up, e.g. SQLAlchemy's compiled cache
+        per_call: List[float] = []
+        for _ in range(self.rounds):
+            started = time.perf_counter()
+            for _ in range(iterations):
+                await self._call(func)
+            per_call.append((time.perf_counter() - started) / iterations)
+
+        median = statistics.median(per_call)
+        result = {
+            "iterations": iterations,
+            "rounds": self.rounds,
+            "min": min(per_call),
+            "median": median,
+            "mean": statistics.fmean(per_call),
+            "stdev": statistics.stdev(per_call) if len(per_call) > 1 else 0.0,
+            "ops_per_sec": 1 / median if median else 0.0,
+        }
+        self.results[name] = result
+        print(f"{name:<48} {median * 1e6:>12.1f} us {result['ops_per_sec']:>12.1f} ops/s", flush=True)
+        return result
+
+    @staticmethod
+    async def _call(func: Callable[[], Any]) -> None:
+        result = func()
+        if inspect.isawaitable(result):
+            await result
+
+
+def save_baseline(path: Path, results: Dict[str, Dict[str, Any]]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "results": results,
+    }
+    path.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+
+
+def load_baseline(path: Path) -> Dict[str, Dict[str, Any]]:
+    return json.loads(path.read_text(encoding="utf-8"))["results"]
+
+
+def compare(
+        baseline: Dict[str, Dict[str, Any]], results: Dict[str, Dict[str, Any]], threshold: float
+) -> List[Tuple[str, float]]:
+    """Print median changes against the baseline, return benchmarks slower by more than ``threshold``."""
+    regressions: List[Tuple[str, float]] = []
+    print(f"\n{'benchmark':<48} {'baseline us':>12} {'current us':>12} {'change':>8}")
+    for name, result in results.items():
+        before = baseline.get(name)
+        if before is None or not before["median"]:
+            print(f"{name:<48} {'-':>12} {result['median'] * 1e6:>12.1f} {'new':>8}")
+            continue
+
+        change = result["median"] / before["median"] - 1
+        marker = " !" if change > threshold else ""
+        print(f"{name:<48} {before['median'] * 1e6:>12.1f} {result['median'] * 1e6:>12.1f} {change * 100:>7.1f}%{marker}")
+        if change > threshold:
+            regressions.append((name, change))
+    return regressions
@@ -0,0 +1,113 @@
+"""Requests/sec of the production server at different worker counts.
+
+Starts ``python -m src.server`` with SERVER_MODE=production for each worker count,
+then keeps ``--connections`` keep-alive HTTP/1.1 connections busy for ``--seconds``.
+The usual backend settings (DATABASE_URL, ...) must be set, since workers run the
+app lifespan.
+
+Usage: python -m benchmarks.load_test [--workers 1 2 4] [--connections 64] [--seconds 10] [--path /metrics]
+"""
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import time
+from typing import List, Tuple
+
+HOST = "127.0.0.1"
+
+
+async def wait_until_ready(port: int, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            _, writer = await asyncio.open_connection(HOST, port)
+        except OSError:
+            await asyncio.sleep(0.2)
+            continue
+        writer.close()
+        await writer.wait_closed()
+        return
+    raise TimeoutError(f"server on port {port} did not start in {timeout}s")
+
+
+async def keep_requesting(port: int, path: str, deadline: float) -> Tuple[int, int]:
+    """Send requests back to back on one connection, return (responses, errors)."""
+    reader, writer = await asyncio.open_connection(HOST, port)
+    request = f"GET {path} HTTP/1.1\r\nHost: {HOST}\r\n\r\n".encode("ascii")
+    responses = errors = 0
+
+    try:
+        while time.monotonic() < deadline:
+            writer.write(request)
+            head = await reader.readuntil(b"\r\n\r\n")
+            status_line, *header_lines = head.decode("latin-1").split("\r\n")
+            length = next(
+                (int(line.split(":", 1)[1]) for line in header_lines if line.lower().startswith("content-length:")),
+                0,
+            )
+            await reader.readexactly(length)
+            if status_line.split()[1].startswith("2"):
+                responses += 1
+            else:
+                errors += 1
+    finally:
+        writer.close()
+        await writer.wait_closed()
+    return responses, errors
+
+
+async def drive(port: int, path: str, connections: int, seconds: float) -> Tuple[float, int]:
+    started = time.monotonic()
+    results = await asyncio.gather(*(
+        keep_requesting(port, path, started + seconds) for _ in range(connections)
+    ))
+    elapsed = time.monotonic() - started
+    return sum(responses for responses, _ in results) / elapsed, sum(errors for _, errors in results)
+
+
+def start_server(workers: int, port: int) -> subprocess.Popen:
+    env = {
+        **os.environ,
+        "SERVER_MODE": "production",
+        "SERVER_WORKERS": str(workers),
+        "SERVER_HOST": HOST,
+        "SERVER_PORT": str(port),
+        "LOG_TO_FILE": os.environ.get("LOG_TO_FILE", "false"),
+    }
+    return subprocess.Popen(
+        [sys.executable, "-m", "src.server"], env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+
+
+async def run(worker_counts: List[int], connections: int, seconds: float, path: str, port: int) -> None:
+    print(f"{'workers':>7} {'req/s':>10} {'errors':>7} {'scaling':>8}")
+    first_rate = None
+    for workers in worker_counts:
+        server = start_server(workers, port)
+        try:
+            await wait_until_ready(port)
+            await drive(port, path, connections, min(seconds, 1.0))  # warm-up
+            rate, errors = await drive(port, path, connections, seconds)
+        finally:
+            server.terminate()
+            server.wait(timeout=30)
+
+        first_rate = first_rate or rate
+        print(f"{workers:>7} {rate:>10.1f} {errors:>7} {rate / first_rate:>7.2f}x", flush=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", nargs="+", type=int, default=[1, 2, 4])
+    parser.add_argument("--connections", type=int, default=64)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--path", default="/metrics")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+    asyncio.run(run(args.workers, args.connections, args.seconds, args.path, args.port))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Benchmark suite for the repository, auth, serialization and app layers.
+
+Usage:
+    python -m benchmarks.run [--suite repository auth serialization app] [--rows 10000 1000000]
+                             [--postgres-url URL] [--rounds 5] [--quick]
+                             [--save benchmarks/baselines/local.json]
+                             [--compare benchmarks/baselines/local.json] [--threshold 0.1]
+
+Postgres runs only when --postgres-url (or BENCHMARK_POSTGRES_URL) points at a
+disposable database. With --compare, the exit code is 1 when a benchmark's median
+is slower than the baseline by more than --threshold.
+"""
+import argparse
+import asyncio
+import os
+import sys
+from pathlib import Path
+from typing import List
+
+from benchmarks.harness import BenchmarkRunner, compare, load_baseline, save_baseline
+
+SUITES = ("repository", "auth", "serialization", "app")
+
+
+async def run(args: argparse.Namespace) -> BenchmarkRunner:
+    runner = BenchmarkRunner(rounds=args.rounds, scale=0.1 if args.quick else 1.0)
+
+    if "repository" in args.suite:
+        from benchmarks.suites import repository
+        await repository.run(runner, args.rows, args.postgres_url)
+    if "auth" in args.suite:
+        from benchmarks.suites import auth
+        await auth.run(runner, bcrypt_rounds=args.bcrypt_rounds)
+    if "serialization" in args.suite:
+        from benchmarks.suites import serialization
+        await serialization.run(runner)
+    if "app" in args.suite:
+        from benchmarks.suites import app
+        await app.run(runner)
+
+    return runner
+
+
+def parse_args(argv: List[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--suite", nargs="+", choices=SUITES, default=list(SUITES))
+    parser.add_argument("--rows", nargs="+", type=int, default=[10_000])
+    parser.add_argument("--postgres-url", default=os.getenv("BENCHMARK_POSTGRES_URL"))
+    parser.add_argument("--bcrypt-rounds", type=int, default=12)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--quick", action="store_true", help="a tenth of the iterations, for smoke runs")
+    parser.add_argument("--save", type=Path)
+    parser.add_argument("--compare", type=Path)
+    parser.add_argument("--threshold", type=float, default=0.1)
+    return parser.parse_args(argv)
+
+
+def main(argv: List[str] | None = None) -> int:
+    args = parse_args(argv)
+    runner = asyncio.run(run(args))
+
+    if args.save:
+        save_baseline(args.save, runner.results)
+        print(f"\nsaved {len(runner.results)} results to {args.save}")
+
+    if args.compare:
+        regressions = compare(load_baseline(args.compare), runner.results, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} benchmark(s) regressed by more than {args.threshold:.0%}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,113 @@
+"""CPU time per repository call with fresh select() statements vs CACHED_STATEMENTS.
+
+"build" is constructing the statement plus its compiled-cache key, the part the
+cached variants save; "call" is the whole repository call against in-memory SQLite.
+
+Usage: python -m benchmarks.statement_cache [--calls 5000] [--rows 1000] [--repeat 3]
+"""
+import argparse
+import asyncio
+import time
+from typing import Awaitable, Callable, Dict
+
+from sqlalchemy import Executable
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.database.base import Base
+from src.database.base_repository import BaseRepository
+
+
+class StatementBenchmarkModel(Base):
+    name: Mapped[str] = mapped_column()
+    age: Mapped[int] = mapped_column()
+
+
+class CachedStatementRepository(BaseRepository[StatementBenchmarkModel]):
+    CACHED_STATEMENTS = True
+
+
+STATEMENTS: Dict[str, Callable[[BaseRepository, int], Executable]] = {
+    "get_by_id": lambda repo, i: repo._get_by_id_stmt(i + 1),
+    "exists": lambda repo, i: repo._exists_stmt((repo.model.age == i % 100,)),
+    "count": lambda repo, i: repo._count_stmt((repo.model.age == i % 100,)),
+    "get_by_conditions": lambda repo, i: repo._get_by_conditions_stmt((repo.model.age == i % 100,), 0, 5),
+}
+
+OPERATIONS: Dict[str, Callable[[BaseRepository, int], Awaitable]] = {
+    "get_by_id": lambda repo, i: repo.get_by_id(i + 1),
+    "exists": lambda repo, i: repo.exists(repo.model.age == i % 100),
+    "count": lambda repo, i: repo.count(repo.model.age == i % 100),
+    "get_by_conditions": lambda repo, i: repo.get_by_conditions(repo.model.age == i % 100, limit=5),
+}
+
+
+def measure_build(
+        repo: BaseRepository, build: Callable[[BaseRepository, int], Executable], calls: int, repeat: int
+) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.process_time()
+        for i in range(calls):
+            build(repo, i)._generate_cache_key()
+        best = min(best, time.process_time() - started)
+    return best / calls
+
+
+async def measure_call(
+        repo: BaseRepository, operation: Callable[[BaseRepository, int], Awaitable], calls: int, rows: int, repeat: int
+) -> float:
+    for i in range(min(calls, 100)):  # warm SQLAlchemy's compiled cache
+        await operation(repo, i % rows)
+
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.process_time()
+        for i in range(calls):
+            await operation(repo, i % rows)
+        best = min(best, time.process_time() - started)
+    return best / calls
+
+
+async def run(calls: int, rows: int, repeat: int) -> None:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all, tables=[StatementBenchmarkModel.__table__])
+
+    session_maker = async_sessionmaker(engine, expire_on_commit=False)
+    async with session_maker() as session:
+        await BaseRepository(session, StatementBenchmarkModel).bulk_create(
+            [{"name": f"row-{i}", "age": i % 100} for i in range(rows)]
+        )
+        await session.commit()
+
+        plain_repo = BaseRepository(session, StatementBenchmarkModel)
+        cached_repo = CachedStatementRepository(session, StatementBenchmarkModel)
+
+        print(f"{'operation':<18} {'stage':<6} {'select us':>10} {'cached us':>10} {'change':>8}")
+        for name, operation in OPERATIONS.items():
+            for stage, plain, cached in (
+                    ("build",
+                     measure_build(plain_repo, STATEMENTS[name], calls, repeat),
+                     measure_build(cached_repo, STATEMENTS[name], calls, repeat)),
+                    ("call",
+                     await measure_call(plain_repo, operation, calls, rows, repeat),
+                     await measure_call(cached_repo, operation, calls, rows, repeat)),
+            ):
+                change = (cached / plain - 1) * 100
+                print(f"{name:<18} {stage:<6} {plain * 1e6:>10.1f} {cached * 1e6:>10.1f} {change:>7.1f}%")
+
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=5000)
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(run(args.calls, args.rows, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from benchmarks.asgi import asgi_request
+from benchmarks.harness import BenchmarkRunner
+from benchmarks.suites.repository import SQLITE_URL, BenchmarkPersonModel, seed
+from src.database.base_repository import BaseRepository
+from src.main import create_app
+
+
+async def run(runner: BenchmarkRunner, rows: int = 1000) -> None:
+    """End-to-end requests through an app built by ``create_app``: routing, middleware,
+    handler and response rendering, with benchmark routes added to that instance only.
+    """
+    app = create_app()
+    engine = create_async_engine(SQLITE_URL)
+    async with engine.begin() as conn:
+        await conn.run_sync(BenchmarkPersonModel.__table__.create)
+    session_maker = async_sessionmaker(engine, expire_on_commit=False)
+    await seed(session_maker, rows)
+
+    async def get_person(person_id: int):
+        async with session_maker() as session:
+            return await BaseRepository(session, BenchmarkPersonModel).get_by_id(person_id)
+
+    async def list_people(limit: int = 20, offset: int = 0):
+        async with session_maker() as session:
+            return await BaseRepository(session, BenchmarkPersonModel).get_all(limit=limit, offset=offset)
+
+    app.add_api_route("/benchmark/people/{person_id}", get_person, methods=["GET"], include_in_schema=False)
+    app.add_api_route("/benchmark/people", list_people, methods=["GET"], include_in_schema=False)
+
+    try:
+        await runner.measure("app.get_metrics", lambda: asgi_request(app, "GET", "/metrics"), iterations=200)
+        await runner.measure(
+            "app.get_record", lambda: asgi_request(app, "GET", f"/benchmark/people/{rows // 2}"), iterations=500
+        )
+        await runner.measure(
+            "app.list_records_20", lambda: asgi_request(app, "GET", "/benchmark/people?limit=20"), iterations=500
+        )
+    finally:
+        await engine.dispose()
@@ -0,0 +1,40 @@
+from benchmarks.harness import BenchmarkRunner
+from src.api.auth.utils.password_hasher.bcrypt_password_hasher import BcryptPasswordHasher
+from src.api.auth.utils.token.jwt_token_service import JWTTokenService
+from src.api.auth.utils.token.verified_token_cache import VerifiedTokenCache
+
+PASSWORD = "benchmark-password"
+CLAIMS = {"sub": "123", "scope": "read write"}
+
+
+async def run(runner: BenchmarkRunner, bcrypt_rounds: int = BcryptPasswordHasher.DEFAULT_ROUNDS) -> None:
+    hasher = BcryptPasswordHasher(rounds=bcrypt_rounds)
+    hashed = hasher.hash_password(PASSWORD)
+    await runner.measure(f"auth.bcrypt.{bcrypt_rounds}.hash", lambda: hasher.hash_password(PASSWORD), iterations=5)
+    await runner.measure(
+        f"auth.bcrypt.{bcrypt_rounds}.verify", lambda: hasher.verify_password(PASSWORD, hashed), iterations=5
+    )
+
+    for algorithm in ("HS256", "EdDSA"):
+        secret = _secret(algorithm)
+        service = JWTTokenService(secret, algorithm)
+        cached_service = JWTTokenService(secret, algorithm, cache=VerifiedTokenCache())
+        token = service.encode(CLAIMS, expire_hour=1)
+
+        await runner.measure(f"auth.jwt.{algorithm}.encode", lambda: service.encode(CLAIMS, 1), iterations=1000)
+        await runner.measure(f"auth.jwt.{algorithm}.decode", lambda: service.decode(token), iterations=1000)
+        await runner.measure(
+            f"auth.jwt.{algorithm}.decode_cached", lambda: cached_service.decode(token), iterations=1000
+        )
+
+
+def _secret(algorithm: str) -> str:
+    if algorithm.startswith("HS"):
+        return "benchmark-secret"
+
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+
+    return Ed25519PrivateKey.generate().private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+    ).decode("ascii")
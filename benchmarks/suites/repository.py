@@ -0,0 +1,110 @@
+import random
+from typing import Sequence
+
+from sqlalchemy import Index
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Mapped, mapped_column
+
+from benchmarks.harness import BenchmarkRunner
+from src.database.base import Base
+from src.database.base_repository import BaseRepository
+from src.pagination import CursorCodec, CursorPaginationParams, PaginationParams
+
+SQLITE_URL = "sqlite+aiosqlite:///:memory:"
+SEED_CHUNK_SIZE = 10_000
+
+
+class BenchmarkPersonModel(Base):
+    name: Mapped[str] = mapped_column()
+    age: Mapped[int] = mapped_column()
+
+    __table_args__ = (
+        Index("ix_benchmarkpersonmodels_age", "age"),
+    )
+
+
+async def run(runner: BenchmarkRunner, rows: Sequence[int], postgres_url: str | None = None) -> None:
+    targets = [("sqlite", SQLITE_URL)]
+    if postgres_url:
+        targets.append(("postgres", postgres_url))
+
+    for backend, url in targets:
+        for amount in rows:
+            engine = create_async_engine(url)
+            try:
+                await _recreate_table(engine)
+                await run_dataset(runner, engine, f"repository.{backend}.{amount}", amount)
+            finally:
+                async with engine.begin() as conn:
+                    await conn.run_sync(BenchmarkPersonModel.__table__.drop, checkfirst=True)
+                await engine.dispose()
+
+
+async def run_dataset(runner: BenchmarkRunner, engine: AsyncEngine, prefix: str, rows: int) -> None:
+    session_maker = async_sessionmaker(engine, expire_on_commit=False)
+    await seed(session_maker, rows)
+    randomizer = random.Random(0)
+    codec = CursorCodec("benchmark")
+
+    async with session_maker() as session:
+        repo = BaseRepository(session, BenchmarkPersonModel)
+        middle_cursor = CursorPaginationParams(limit=20, cursor=codec.encode([rows // 2], repo.cursor_scope()))
+
+        async def get_by_id():
+            await repo.get_by_id(randomizer.randint(1, rows))
+            session.expunge_all()  # keep the identity map from growing across iterations
+
+        async def get_by_conditions():
+            await repo.get_by_conditions(repo.model.age == randomizer.randint(0, 99), limit=10)
+            session.expunge_all()
+
+        async def count_filtered():
+            await repo.count(repo.model.age == randomizer.randint(0, 99))
+
+        async def paginate_middle():
+            await repo.paginate(PaginationParams(limit=20, offset=rows // 2))
+            session.expunge_all()
+
+        async def paginate_by_cursor_middle():
+            await repo.paginate_by_cursor(middle_cursor, codec)
+            session.expunge_all()
+
+        async def create():
+            await repo.create({"name": "created", "age": 1})
+            await session.flush()
+
+        async def update_by_id():
+            await repo.update_by_id(randomizer.randint(1, rows), {"age": randomizer.randint(0, 99)})
+
+        async def bulk_create():
+            await repo.bulk_create([{"name": "bulk", "age": age % 100} for age in range(100)])
+
+        await runner.measure(f"{prefix}.get_by_id", get_by_id, iterations=500)
+        await runner.measure(f"{prefix}.get_by_conditions", get_by_conditions, iterations=200)
+        await runner.measure(f"{prefix}.count", repo.count, iterations=20)
+        await runner.measure(f"{prefix}.count_filtered", count_filtered, iterations=100)
+        await runner.measure(f"{prefix}.paginate_middle", paginate_middle, iterations=20)
+        await runner.measure(f"{prefix}.paginate_by_cursor_middle", paginate_by_cursor_middle, iterations=200)
+
+        await runner.measure(f"{prefix}.create", create, iterations=500)
+        await runner.measure(f"{prefix}.update_by_id", update_by_id, iterations=500)
+        await runner.measure(f"{prefix}.bulk_create_100", bulk_create, iterations=50)
+        await session.rollback()  # keep the dataset the same for the next run
+
+
+async def seed(session_maker: async_sessionmaker, rows: int) -> None:
+    randomizer = random.Random(rows)
+    async with session_maker() as session:
+        repo = BaseRepository(session, BenchmarkPersonModel)
+        for start in range(0, rows, SEED_CHUNK_SIZE):
+            await repo.bulk_create([
+                {"name": f"person-{index}", "age": randomizer.randint(0, 99)}
+                for index in range(start, min(start + SEED_CHUNK_SIZE, rows))
+            ])
+        await session.commit()
+
+
+async def _recreate_table(engine: AsyncEngine) -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(BenchmarkPersonModel.__table__.drop, checkfirst=True)
+        await conn.run_sync(BenchmarkPersonModel.__table__.create)
@@ -0,0 +1,13 @@
+from benchmarks.harness import BenchmarkRunner
+from benchmarks.suites.repository import BenchmarkPersonModel
+from src.pagination import Pagination
+from src.responses import dumps
+
+
+async def run(runner: BenchmarkRunner) -> None:
+    records = [BenchmarkPersonModel(id=index, name=f"person-{index}", age=index % 100) for index in range(100)]
+    page = Pagination(count=len(records), items=records)
+
+    await runner.measure("serialization.to_dict", records[0].to_dict, iterations=10_000)
+    await runner.measure("serialization.dumps_100_records", lambda: dumps(records), iterations=1000)
+    await runner.measure("serialization.page_as_response_100", page.as_response, iterations=1000)
@@ -11,5 +11,5 @@ done
 echo "Database is available, run migrations"
 alembic upgrade head
 
-echo "Start uvicorn"
-exec uvicorn src.main:app --host 0.0.0.0 --port 8000 --reload
\ No newline at end of file
+echo "Start uvicorn (SERVER_MODE=${SERVER_MODE:-development})"
+exec python -m src.server
\ No newline at end of file
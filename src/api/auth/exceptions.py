@@ -15,3 +15,13 @@ class InvalidTokenException(AppException):
     def __init__(self):
         message = "Invalid token"
         super().__init__(message, 401)
+
+class RevokedTokenException(AppException):
+    def __init__(self):
+        message = "Revoked token"
+        super().__init__(message, 401)
+
+class PasswordHasherOverloadedException(AppException):
+    def __init__(self):
+        message = "Too many password hashing requests, try again later"
+        super().__init__(message, 503)
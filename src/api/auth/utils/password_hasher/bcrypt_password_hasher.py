@@ -1,17 +1,40 @@
 import bcrypt
 
+from src.config import HashingSettings
+from src.timing import timed
+from src.api.auth.utils.password_hasher.hashing_executor import HashingExecutor, create_hashing_executor
 from src.api.auth.utils.password_hasher.password_hasher import PasswordHasher
 
 
 class BcryptPasswordHasher(PasswordHasher):
+    DEFAULT_ROUNDS = 12
 
-    @staticmethod
-    def hash_password(password: str) -> bytes:
-        salt = bcrypt.gensalt()
+    def __init__(self, rounds: int = DEFAULT_ROUNDS, executor: HashingExecutor | None = None):
+        super().__init__(executor)
+        self.rounds = rounds
+
+    @timed("hash")
+    def hash_password(self, password: str) -> bytes:
+        salt = bcrypt.gensalt(rounds=self.rounds)
         return bcrypt.hashpw(password.encode("utf-8"), salt)
 
-    @staticmethod
-    def verify_password(plain_password: str, hashed_password: bytes):
+    @timed("hash")
+    def verify_password(self, plain_password: str, hashed_password: bytes) -> bool:
         return bcrypt.checkpw(
             plain_password.encode("utf-8"), hashed_password
         )
+
+    def needs_rehash(self, hashed_password: bytes) -> bool:
+        return self.get_rounds(hashed_password) != self.rounds
+
+    @staticmethod
+    def get_rounds(hashed_password: bytes) -> int:
+        # modular crypt format: $2b$<cost>$<salt + hash>
+        return int(hashed_password.split(b"$")[2])
+
+
+def create_password_hasher(hashing_settings: HashingSettings) -> BcryptPasswordHasher:
+    return BcryptPasswordHasher(
+        rounds=hashing_settings.password_hash_rounds,
+        executor=create_hashing_executor(hashing_settings),
+    )
@@ -0,0 +1,74 @@
+import asyncio
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict
+
+from src.api.auth.exceptions import PasswordHasherOverloadedException
+from src.config import HashingSettings
+
+
+class HashingExecutor:
+    """Bounded pool for CPU-heavy hashing calls made from async code.
+
+    At most ``max_workers`` hashes run at once and ``max_queue`` more may wait,
+    anything beyond that is rejected with a 503 instead of stalling the event loop.
+    bcrypt releases the GIL, so threads are enough unless the hasher does not.
+    """
+
+    def __init__(self, max_workers: int = 4, max_queue: int = 64, use_processes: bool = False):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.use_processes = use_processes
+        self.in_flight = 0
+        self.completed = 0
+        self.rejected = 0
+        self.busy_seconds = 0.0
+        self._executor: Executor | None = None
+
+    @property
+    def queue_depth(self) -> int:
+        return max(self.in_flight - self.max_workers, 0)
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        if self.in_flight >= self.max_workers + self.max_queue:
+            self.rejected += 1
+            raise PasswordHasherOverloadedException()
+
+        self.in_flight += 1
+        started = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), partial(func, *args))
+        finally:
+            self.in_flight -= 1
+            self.completed += 1
+            self.busy_seconds += time.perf_counter() - started
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "in_flight": self.in_flight,
+            "queue_depth": self.queue_depth,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "busy_seconds": self.busy_seconds,
+        }
+
+    def shutdown(self, wait: bool = True) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            executor_class = ProcessPoolExecutor if self.use_processes else ThreadPoolExecutor
+            self._executor = executor_class(max_workers=self.max_workers)
+        return self._executor
+
+
+def create_hashing_executor(hashing_settings: HashingSettings) -> HashingExecutor:
+    return HashingExecutor(
+        max_workers=hashing_settings.password_hash_workers,
+        max_queue=hashing_settings.password_hash_max_queue,
+        use_processes=hashing_settings.password_hash_use_processes,
+    )
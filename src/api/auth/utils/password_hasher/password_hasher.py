@@ -1,12 +1,44 @@
 from abc import ABC, abstractmethod
+from typing import Tuple
+
+from src.api.auth.utils.password_hasher.hashing_executor import HashingExecutor
+from src.timing import timed
 
 
 class PasswordHasher(ABC):
+    def __init__(self, executor: HashingExecutor | None = None):
+        self.executor = executor or HashingExecutor()
+
+    @abstractmethod
+    def hash_password(self, password: str) -> bytes: ...
 
-    @staticmethod
     @abstractmethod
-    def hash_password(password: str) -> bytes: ...
+    def verify_password(self, plain_password: str, hashed_password: bytes) -> bool: ...
 
-    @staticmethod
     @abstractmethod
-    def verify_password(plain_password: str, hashed_password: bytes): ...
+    def needs_rehash(self, hashed_password: bytes) -> bool: ...
+
+    def verify_and_update(self, plain_password: str, hashed_password: bytes) -> Tuple[bool, bytes | None]:
+        """Verify and, when the stored hash uses outdated parameters, return a fresh one to persist."""
+        if not self.verify_password(plain_password, hashed_password):
+            return False, None
+        if self.needs_rehash(hashed_password):
+            return True, self.hash_password(plain_password)
+        return True, None
+
+    @timed("hash")
+    async def ahash_password(self, password: str) -> bytes:
+        return await self.executor.run(self.hash_password, password)
+
+    @timed("hash")
+    async def averify_password(self, plain_password: str, hashed_password: bytes) -> bool:
+        return await self.executor.run(self.verify_password, plain_password, hashed_password)
+
+    @timed("hash")
+    async def averify_and_update(self, plain_password: str, hashed_password: bytes) -> Tuple[bool, bytes | None]:
+        return await self.executor.run(self.verify_and_update, plain_password, hashed_password)
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state.pop("executor", None)  # bound methods are pickled for process pools
+        return state
@@ -0,0 +1,106 @@
+from pathlib import Path
+from typing import Any, Dict, List, Sequence
+
+import jwt
+from jwt.algorithms import HMACAlgorithm
+
+
+class JWTKey:
+    """One signing/verification key identified by ``kid``.
+
+    Asymmetric keys (RS*/PS*/ES*/EdDSA) take PEM material: a private key can sign
+    and its public half is derived for verification, a public key only verifies.
+    HMAC keys use the same secret for both.
+    """
+
+    def __init__(
+            self,
+            kid: str | None,
+            algorithm: str,
+            signing_key: str | bytes | None = None,
+            verification_key: str | bytes | None = None,
+    ):
+        self.kid = kid
+        self.algorithm = algorithm
+        self._algorithm = jwt.get_algorithm_by_name(algorithm)
+
+        self.signing_key = self._algorithm.prepare_key(signing_key) if signing_key is not None else None
+        if verification_key is not None:
+            self.verification_key = self._algorithm.prepare_key(verification_key)
+        elif self.is_symmetric:
+            self.verification_key = self.signing_key
+        else:
+            self.verification_key = self.signing_key.public_key()
+
+    @property
+    def is_symmetric(self) -> bool:
+        return isinstance(self._algorithm, HMACAlgorithm)
+
+    @property
+    def can_sign(self) -> bool:
+        return self.signing_key is not None
+
+    def to_jwk(self) -> Dict[str, Any]:
+        jwk = self._algorithm.to_jwk(self.verification_key, as_dict=True)
+        jwk.update({"kid": self.kid, "alg": self.algorithm, "use": "sig"})
+        return jwk
+
+
+class JWTKeyring:
+    """Keys accepted for verification, one of them active for signing. Tokens
+    without a ``kid`` header are checked against the key whose kid is ``None``.
+
+    During rotation the new key is added and activated while the previous one
+    stays for verification until every token it signed has expired.
+    """
+
+    def __init__(self, keys: Sequence[JWTKey], active_kid: str | None = None):
+        self._keys: Dict[str | None, JWTKey] = {key.kid: key for key in keys}
+        if active_kid is None:  # verify-only keyrings have no signing key at all
+            active_kid = next((key.kid for key in keys if key.can_sign), None)
+        self.active_kid = active_kid
+
+    @classmethod
+    def from_secret(cls, secret: str, algorithm: str) -> "JWTKeyring":
+        return cls([JWTKey(None, algorithm, secret)])
+
+    @classmethod
+    def from_directory(cls, path: str | Path, algorithm: str, active_kid: str) -> "JWTKeyring":
+        """Load ``<kid>.pem`` files, private keys can sign, public keys only verify."""
+        keys: List[JWTKey] = []
+        for pem_path in sorted(Path(path).glob("*.pem")):
+            pem = pem_path.read_bytes()
+            if b"PRIVATE KEY" in pem:
+                keys.append(JWTKey(pem_path.stem, algorithm, signing_key=pem))
+            else:
+                keys.append(JWTKey(pem_path.stem, algorithm, verification_key=pem))
+        return cls(keys, active_kid)
+
+    @property
+    def active(self) -> JWTKey:
+        key = self._keys.get(self.active_kid)
+        if key is None or not key.can_sign:
+            raise ValueError("keyring has no active signing key")
+        return key
+
+    def get(self, kid: str | None) -> JWTKey | None:
+        return self._keys.get(kid)
+
+    def add(self, key: JWTKey, activate: bool = False) -> None:
+        self._keys[key.kid] = key
+        if activate:
+            self.activate(key.kid)
+
+    def activate(self, kid: str | None) -> None:
+        if not self._keys[kid].can_sign:
+            raise ValueError(f"key {kid} has no signing key")
+        self.active_kid = kid
+
+    def retire(self, kid: str | None) -> None:
+        if kid == self.active_kid:
+            raise ValueError("cannot retire the active key")
+        self._keys.pop(kid, None)
+
+    def jwks(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Public JWKS document, symmetric secrets are never published."""
+        return {"keys": [key.to_jwk() for key in self._keys.values() if not key.is_symmetric]}
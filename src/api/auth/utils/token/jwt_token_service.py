@@ -2,20 +2,36 @@ from datetime import timedelta, datetime
 
 import jwt
 
+from src.config import TokenSettings
+from src.timing import timed
+from src.api.auth.utils.token.jwt_keyring import JWTKeyring
 from src.api.auth.utils.token.token_service import TokenService
+from src.api.auth.utils.token.verified_token_cache import VerifiedTokenCache
 from src.api.auth.exceptions import (
     ExpiredTokenException, DecodeTokenException, InvalidTokenException
 )
 
 
 class JWTTokenService(TokenService):
-    def __init__(self, secret: str, algorithm: str):
-        self.secret = secret
-        self.algorithm = algorithm
+    def __init__(
+            self,
+            secret: str | None = None,
+            algorithm: str | None = None,
+            cache: VerifiedTokenCache | None = None,
+            keyring: JWTKeyring | None = None,
+    ):
+        self.keyring = keyring or JWTKeyring.from_secret(secret, algorithm)
+        self.cache = cache
 
+    @timed("token")
     def decode(self, token: str) -> dict:
+        if self.cache is not None:
+            claims = self.cache.get(token)
+            if claims is not None:
+                return claims
+
         try:
-            return self._decode(token)
+            claims = self._decode(token)
         except jwt.ExpiredSignatureError:
             raise ExpiredTokenException()
         except jwt.DecodeError:
@@ -23,16 +39,69 @@ class JWTTokenService(TokenService):
         except jwt.InvalidTokenError:
             raise InvalidTokenException()
 
+        if self.cache is not None:
+            self.cache.set(token, claims)
+        return claims
+
+    def rotate_secret(self, secret: str) -> None:
+        """Replace a single-secret HMAC keyring; tokens signed with the old secret stop verifying.
+
+        Keyrings with kids (e.g. loaded from ``TOKEN_KEYS_DIR``) rotate with
+        ``keyring.add(key, activate=True)`` followed by ``retire_key``.
+        """
+        active = self.keyring.active
+        if not active.is_symmetric or active.kid is not None:
+            raise ValueError(
+                "rotate_secret only replaces a single HMAC secret, "
+                "use keyring.add(key, activate=True) and retire_key(kid) instead"
+            )
+        self.keyring = JWTKeyring.from_secret(secret, active.algorithm)
+        self._flush_cache()
+
+    def retire_key(self, kid: str) -> None:
+        self.keyring.retire(kid)
+        self._flush_cache()
+
+    def jwks(self) -> dict:
+        return self.keyring.jwks()
+
     def _decode(self, token: str) -> dict:
-        return jwt.decode(token, self.secret, algorithms=[self.algorithm])
+        kid = jwt.get_unverified_header(token).get("kid")
+        key = self.keyring.get(kid)
+        if key is None:
+            raise jwt.InvalidTokenError(f"unknown kid {kid}")
+        return jwt.decode(token, key.verification_key, algorithms=[key.algorithm])
+
+    def _flush_cache(self) -> None:
+        if self.cache is not None:
+            self.cache.clear()
+
+    @timed("token")
+    def encode(self, data: dict, expire_hour: int | None = None, *, expires_in: timedelta | None = None) -> str:
+        if expires_in is None:
+            if expire_hour is None:
+                raise ValueError("encode needs expire_hour or expires_in")
+            expires_in = timedelta(hours=expire_hour)
 
-    def encode(self, data: dict, expire_hour: int) -> str:
         data_copy = data.copy()
-        expired = self._get_expired_time(expire_hour)
+        expired = self._get_expired_time(expires_in)
         data_copy.update({"exp": expired})
-        return jwt.encode(data_copy, self.secret, algorithm=self.algorithm)
+
+        key = self.keyring.active
+        headers = {"kid": key.kid} if key.kid is not None else None
+        return jwt.encode(data_copy, key.signing_key, algorithm=key.algorithm, headers=headers)
 
     @staticmethod
-    def _get_expired_time(expire_hour: int) -> int:
-        expire_time = datetime.now() + timedelta(hours=expire_hour)
+    def _get_expired_time(expires_in: timedelta) -> int:
+        expire_time = datetime.now() + expires_in
         return int(expire_time.timestamp())
+
+
+def create_token_service(token_settings: TokenSettings) -> JWTTokenService:
+    cache = VerifiedTokenCache(token_settings.token_cache_size) if token_settings.token_cache_size else None
+    keyring = None
+    if token_settings.token_keys_dir:
+        keyring = JWTKeyring.from_directory(
+            token_settings.token_keys_dir, token_settings.token_algorithm, token_settings.token_active_kid
+        )
+    return JWTTokenService(token_settings.secret_key, token_settings.token_algorithm, cache, keyring)
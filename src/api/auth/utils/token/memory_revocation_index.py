@@ -0,0 +1,43 @@
+import heapq
+import time
+from typing import Dict, List, Tuple
+
+from src.api.auth.utils.token.revocation_index import RevocationIndex
+
+
+class MemoryRevocationIndex(RevocationIndex):
+    """Per-process denylist for single-worker setups and tests.
+
+    Expiry times are also kept in a heap, so pruning only pops the entries that
+    have expired instead of scanning the whole denylist.
+    """
+
+    def __init__(self):
+        self._revoked: Dict[str, int] = {}
+        self._expiry: List[Tuple[int, str]] = []
+
+    async def revoke(self, jti: str, expires_at: int) -> None:
+        self._prune()
+        self._add(jti, expires_at)
+
+    async def revoke_once(self, jti: str, expires_at: int) -> bool:
+        self._prune()
+        if jti in self._revoked or expires_at <= time.time():
+            return False
+        self._add(jti, expires_at)
+        return True
+
+    async def is_revoked(self, jti: str) -> bool:
+        expires_at = self._revoked.get(jti)
+        return expires_at is not None and expires_at > time.time()
+
+    def _add(self, jti: str, expires_at: int) -> None:
+        self._revoked[jti] = expires_at
+        heapq.heappush(self._expiry, (expires_at, jti))
+
+    def _prune(self) -> None:
+        now = time.time()
+        while self._expiry and self._expiry[0][0] <= now:
+            expires_at, jti = heapq.heappop(self._expiry)
+            if self._revoked.get(jti) == expires_at:  # skip entries superseded by a later revoke
+                del self._revoked[jti]
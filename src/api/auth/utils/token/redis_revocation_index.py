@@ -0,0 +1,34 @@
+import time
+
+from redis.asyncio import Redis
+
+from src.api.auth.utils.token.revocation_index import RevocationIndex
+
+
+class RedisRevocationIndex(RevocationIndex):
+    """Denylist shared by every worker, entries expire together with the token."""
+
+    def __init__(self, client: Redis, prefix: str = "revoked"):
+        self.client = client
+        self.prefix = prefix
+
+    @classmethod
+    def from_url(cls, url: str, prefix: str = "revoked") -> "RedisRevocationIndex":
+        return cls(Redis.from_url(url), prefix)
+
+    async def revoke(self, jti: str, expires_at: int) -> None:
+        ttl = int(expires_at - time.time())
+        if ttl > 0:
+            await self.client.set(self._key(jti), 1, ex=ttl)
+
+    async def revoke_once(self, jti: str, expires_at: int) -> bool:
+        ttl = int(expires_at - time.time())
+        if ttl <= 0:
+            return False
+        return bool(await self.client.set(self._key(jti), 1, ex=ttl, nx=True))
+
+    async def is_revoked(self, jti: str) -> bool:
+        return bool(await self.client.exists(self._key(jti)))
+
+    def _key(self, jti: str) -> str:
+        return f"{self.prefix}:{jti}"
@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+
+
+class RevocationIndex(ABC):
+    """Denylist of revoked token ids (``jti``), kept until the token would expire anyway."""
+
+    @abstractmethod
+    async def revoke(self, jti: str, expires_at: int) -> None: ...
+
+    @abstractmethod
+    async def revoke_once(self, jti: str, expires_at: int) -> bool:
+        """Atomically revoke ``jti``, False when it was already revoked (or has expired)."""
+
+    @abstractmethod
+    async def is_revoked(self, jti: str) -> bool: ...
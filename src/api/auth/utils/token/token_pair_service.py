@@ -0,0 +1,98 @@
+import uuid
+from datetime import timedelta
+
+from pydantic import BaseModel
+
+from src.config import TokenSettings
+from src.api.auth.exceptions import InvalidTokenException, RevokedTokenException
+from src.api.auth.utils.token.memory_revocation_index import MemoryRevocationIndex
+from src.api.auth.utils.token.redis_revocation_index import RedisRevocationIndex
+from src.api.auth.utils.token.revocation_index import RevocationIndex
+from src.api.auth.utils.token.token_service import TokenService
+
+
+class TokenPair(BaseModel):
+    access_token: str
+    refresh_token: str
+    token_type: str
+
+
+class TokenPairService:
+    """Short-lived access tokens plus rotating refresh tokens.
+
+    Every token carries a ``jti``; a refresh token is revoked as soon as it is
+    exchanged, so a stolen one can be used at most once.
+    """
+
+    ACCESS = "access"
+    REFRESH = "refresh"
+    RESERVED_CLAIMS = ("exp", "jti", "type")
+
+    def __init__(
+            self,
+            token_service: TokenService,
+            revocation_index: RevocationIndex,
+            access_expires: timedelta,
+            refresh_expires: timedelta,
+            token_type: str = "Bearer",
+    ):
+        self.token_service = token_service
+        self.revocation_index = revocation_index
+        self.access_expires = access_expires
+        self.refresh_expires = refresh_expires
+        self.token_type = token_type
+
+    def issue(self, data: dict) -> TokenPair:
+        return TokenPair(
+            access_token=self._encode(data, self.ACCESS, self.access_expires),
+            refresh_token=self._encode(data, self.REFRESH, self.refresh_expires),
+            token_type=self.token_type,
+        )
+
+    async def verify_access(self, token: str) -> dict:
+        return await self._verify(token, self.ACCESS)
+
+    async def refresh(self, refresh_token: str) -> TokenPair:
+        claims = self._decode(refresh_token, self.REFRESH)
+        if not await self.revocation_index.revoke_once(claims["jti"], claims["exp"]):
+            raise RevokedTokenException()  # already exchanged, possibly by a concurrent refresh
+
+        data = {key: value for key, value in claims.items() if key not in self.RESERVED_CLAIMS}
+        return self.issue(data)
+
+    async def revoke(self, token: str) -> None:
+        claims = self.token_service.decode(token)
+        if "jti" not in claims:  # not issued by this service, nothing to revoke
+            raise InvalidTokenException()
+        await self.revocation_index.revoke(claims["jti"], claims["exp"])
+
+    async def _verify(self, token: str, token_type: str) -> dict:
+        claims = self._decode(token, token_type)
+        if await self.revocation_index.is_revoked(claims["jti"]):
+            raise RevokedTokenException()
+        return claims
+
+    def _decode(self, token: str, token_type: str) -> dict:
+        claims = self.token_service.decode(token)
+        if claims.get("type") != token_type or "jti" not in claims:
+            raise InvalidTokenException()
+        return claims
+
+    def _encode(self, data: dict, token_type: str, expires_in: timedelta) -> str:
+        claims = {**data, "jti": uuid.uuid4().hex, "type": token_type}
+        return self.token_service.encode(claims, expires_in=expires_in)
+
+
+def create_token_pair_service(token_service: TokenService, token_settings: TokenSettings) -> TokenPairService:
+    if token_settings.token_revocation_redis_url:
+        revocation_index = RedisRevocationIndex.from_url(token_settings.token_revocation_redis_url)
+    else:
+        revocation_index = MemoryRevocationIndex()
+
+    return TokenPairService(
+        token_service,
+        revocation_index,
+        access_expires=timedelta(minutes=token_settings.access_token_expire_minutes),
+        refresh_expires=timedelta(minutes=token_settings.refresh_token_expire_minutes),
+        token_type=token_settings.token_type,
+    )
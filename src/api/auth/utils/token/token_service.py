@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from datetime import timedelta
 
 
 class TokenService(ABC):
@@ -8,4 +9,4 @@ class TokenService(ABC):
     def decode(self, token: str) -> dict: ...
 
     @abstractmethod
-    def encode(self, data: dict, expire_hour: int) -> str: ...
+    def encode(self, data: dict, expire_hour: int | None = None, *, expires_in: timedelta | None = None) -> str: ...
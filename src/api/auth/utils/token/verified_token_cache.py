@@ -0,0 +1,52 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Tuple
+
+
+class VerifiedTokenCache:
+    """Bounded LRU of already verified claims, keyed by a digest of the token.
+
+    An entry is only served until the token's own ``exp``, after that the token
+    goes through full verification again (and fails as expired).
+    """
+
+    def __init__(self, max_size: int = 10_000):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[bytes, Tuple[float, dict]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, token: str) -> dict | None:
+        key = self._digest(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.time():
+                self._entries.pop(key, None)
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return dict(entry[1])
+
+    def set(self, token: str, claims: dict) -> None:
+        expires_at = claims.get("exp", float("inf"))
+        with self._lock:
+            self._entries[self._digest(token)] = (expires_at, dict(claims))
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every entry, e.g. after rotating the signing secret."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+
+    @staticmethod
+    def _digest(token: str) -> bytes:
+        return hashlib.sha256(token.encode("utf-8")).digest()
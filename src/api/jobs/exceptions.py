@@ -0,0 +1,12 @@
+from src.exceptions import AppException
+
+
+class UnknownJobException(AppException):
+    def __init__(self, name: str):
+        message = f"Unknown job {name}"
+        super().__init__(message, 404)
+
+class JobFailedException(AppException):
+    def __init__(self, job_id: str):
+        message = f"Job {job_id} failed"
+        super().__init__(message, 500)
@@ -0,0 +1,81 @@
+from typing import Any, Dict, Sequence
+
+from celery import Celery, states
+from celery.result import AsyncResult
+from starlette.concurrency import run_in_threadpool
+
+from src.api.jobs.exceptions import UnknownJobException
+from src.api.jobs.schemas import JobStatus
+from src.cache.cache_backend import CacheBackend
+from src.cache.memory_cache_backend import MemoryCacheBackend
+from src.config import CelerySettings
+from src.logs import setup_logger
+
+
+logger = setup_logger(__name__)
+
+
+class JobService:
+    """Enqueue allow-listed Celery tasks and read their state from the result backend.
+
+    Finished jobs never change again, so their status is kept in ``result_cache``
+    and later polls don't reach the backend. Celery reports unknown ids as PENDING.
+    Worker exceptions are logged here, clients only get ``FAILURE_MESSAGE``.
+    """
+
+    CACHE_PREFIX = "job:"
+    FAILURE_MESSAGE = "Job failed"
+
+    def __init__(self, celery_app: Celery, allowed_tasks: Sequence[str], result_cache: CacheBackend):
+        self.celery_app = celery_app
+        self.allowed_tasks = frozenset(allowed_tasks)
+        self.result_cache = result_cache
+
+    async def submit(self, name: str, args: Sequence[Any] = (), kwargs: Dict[str, Any] | None = None) -> JobStatus:
+        if name not in self.allowed_tasks:
+            raise UnknownJobException(name)
+
+        result = await run_in_threadpool(self._send, name, list(args), kwargs or {})
+        return await self._remember(result)  # eager results are ready right away
+
+    async def status(self, job_id: str) -> JobStatus:
+        cached = await self.result_cache.get(self.CACHE_PREFIX + job_id)
+        if cached is not None:
+            return JobStatus(**cached)
+        return await self._remember(self.celery_app.AsyncResult(job_id))
+
+    def _send(self, name: str, args: list, kwargs: Dict[str, Any]) -> AsyncResult:
+        task = self.celery_app.tasks.get(name)
+        if task is None:  # the web process doesn't need to import worker code
+            return self.celery_app.send_task(name, args, kwargs)
+        if self.celery_app.conf.task_always_eager:
+            return task.apply(args, kwargs, throw=False)  # failures are reported through the job status
+        return task.apply_async(args, kwargs)
+
+    async def _remember(self, result: AsyncResult) -> JobStatus:
+        status = await run_in_threadpool(self._read_status, result)
+        if status.ready:
+            await self.result_cache.set(self.CACHE_PREFIX + status.job_id, status.model_dump())
+        return status
+
+    @staticmethod
+    def _read_status(result: AsyncResult) -> JobStatus:
+        state = result.state
+        status = JobStatus(job_id=result.id, status=state, ready=state in states.READY_STATES)
+        if state == states.SUCCESS:
+            status.result = result.result
+        elif state == states.FAILURE:
+            logger.error(f"job {result.id} failed: {result.result!r}")
+            status.error = JobService.FAILURE_MESSAGE
+        return status
+
+
+def create_job_service(celery_app: Celery, celery_settings: CelerySettings) -> JobService:
+    return JobService(
+        celery_app,
+        allowed_tasks=celery_settings.celery_job_tasks,
+        result_cache=MemoryCacheBackend(
+            max_size=celery_settings.celery_job_result_cache_size,
+            ttl=celery_settings.celery_job_result_cache_ttl,
+        ),
+    )
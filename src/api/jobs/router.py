@@ -0,0 +1,47 @@
+from functools import lru_cache
+
+from celery import states
+from fastapi import APIRouter, Depends, Request
+
+from src.api.jobs.exceptions import JobFailedException
+from src.api.jobs.job_service import JobService, create_job_service
+from src.api.jobs.schemas import JobStatus, JobSubmission
+from src.config import get_settings
+from src.responses import FastJSONResponse
+
+
+router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+@lru_cache
+def get_job_service() -> JobService:
+    from src.celery_app import celery_app  # keeps importing the API free of Celery settings
+
+    return create_job_service(celery_app, get_settings().celery_settings)
+
+@router.post("/{name}", status_code=202, response_model=JobStatus)
+async def submit_job(
+        name: str,
+        request: Request,
+        submission: JobSubmission | None = None,
+        job_service: JobService = Depends(get_job_service),
+) -> FastJSONResponse:
+    submission = submission or JobSubmission()
+    status = await job_service.submit(name, submission.args, submission.kwargs)
+    location = request.url_for("get_job_status", job_id=status.job_id)
+    return FastJSONResponse(
+        status.model_dump(exclude={"result"}), status_code=202, headers={"Location": str(location)}
+    )
+
+@router.get("/{job_id}", response_model=JobStatus)
+async def get_job_status(job_id: str, job_service: JobService = Depends(get_job_service)) -> FastJSONResponse:
+    status = await job_service.status(job_id)
+    return FastJSONResponse(status.model_dump(exclude={"result"}))
+
+@router.get("/{job_id}/result")
+async def get_job_result(job_id: str, job_service: JobService = Depends(get_job_service)) -> FastJSONResponse:
+    status = await job_service.status(job_id)
+    if not status.ready:
+        return FastJSONResponse(status.model_dump(exclude={"result"}), status_code=202)
+    if status.status != states.SUCCESS:
+        raise JobFailedException(job_id)
+    return FastJSONResponse({"job_id": job_id, "result": status.result})
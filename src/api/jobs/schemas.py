@@ -0,0 +1,15 @@
+from typing import Any, Dict, List
+
+from pydantic import BaseModel
+
+
+class JobSubmission(BaseModel):
+    args: List[Any] = []
+    kwargs: Dict[str, Any] = {}
+
+class JobStatus(BaseModel):
+    job_id: str
+    status: str
+    ready: bool
+    result: Any = None
+    error: str | None = None
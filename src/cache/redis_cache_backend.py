@@ -0,0 +1,34 @@
+import json
+from typing import Any
+
+from redis.asyncio import Redis
+
+from src.cache.cache_backend import CacheBackend
+
+
+class RedisCacheBackend(CacheBackend):
+    def __init__(self, client: Redis, prefix: str = "cache"):
+        self.client = client
+        self.prefix = prefix
+
+    @classmethod
+    def from_url(cls, url: str, prefix: str = "cache") -> "RedisCacheBackend":
+        return cls(Redis.from_url(url), prefix)
+
+    async def get(self, key: str) -> Any | None:
+        raw = await self.client.get(self._key(key))
+        return json.loads(raw) if raw is not None else None
+
+    async def set(self, key: str, value: Any, ttl: int | None = None) -> None:
+        await self.client.set(self._key(key), json.dumps(value, default=str), ex=ttl)
+
+    async def delete(self, *keys: str) -> None:
+        if keys:
+            await self.client.delete(*(self._key(key) for key in keys))
+
+    async def clear(self) -> None:
+        async for key in self.client.scan_iter(match=f"{self.prefix}:*"):
+            await self.client.delete(key)
+
+    def _key(self, key: str) -> str:
+        return f"{self.prefix}:{key}"
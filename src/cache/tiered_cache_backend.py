@@ -0,0 +1,31 @@
+from typing import Any
+
+from src.cache.cache_backend import CacheBackend
+
+
+class TieredCacheBackend(CacheBackend):
+    """Looks tiers up in order (fastest first) and backfills the tiers that missed."""
+
+    def __init__(self, *tiers: CacheBackend):
+        self.tiers = tiers
+
+    async def get(self, key: str) -> Any | None:
+        for index, tier in enumerate(self.tiers):
+            value = await tier.get(key)
+            if value is not None:
+                for missed_tier in self.tiers[:index]:
+                    await missed_tier.set(key, value)
+                return value
+        return None
+
+    async def set(self, key: str, value: Any, ttl: int | None = None) -> None:
+        for tier in self.tiers:
+            await tier.set(key, value, ttl)
+
+    async def delete(self, *keys: str) -> None:
+        for tier in self.tiers:
+            await tier.delete(*keys)
+
+    async def clear(self) -> None:
+        for tier in self.tiers:
+            await tier.clear()
@@ -1,10 +1,20 @@
 from celery import Celery
 
-from src.config import settings
+from src.config import get_settings
 
 
+celery_settings = get_settings().celery_settings
+
 celery_app = Celery(
-    settings.celery_settings.celery_app_name,
-    broker=settings.celery_settings.celery_broker_url,
-    backend=settings.celery_settings.celery_backend_url,
+    celery_settings.celery_app_name,
+    broker=celery_settings.celery_broker_url,
+    backend=celery_settings.celery_backend_url,
+)
+
+celery_app.conf.update(
+    worker_prefetch_multiplier=celery_settings.celery_prefetch_multiplier,
+    task_acks_late=celery_settings.celery_acks_late,
+    task_reject_on_worker_lost=celery_settings.celery_acks_late,
+    task_always_eager=celery_settings.celery_task_always_eager,
+    task_eager_propagates=True,
 )
@@ -1,3 +1,7 @@
+from functools import cached_property, lru_cache
+from typing import Literal, List
+
+from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -10,21 +14,109 @@ class CommonSettings(BaseSettings):
 class DataBaseSettings(CommonSettings):
     database_url: str
     database_echo: bool
+    database_profile: Literal["api", "celery", "tests"] = "api"
+    database_pool_size: int | None = None
+    database_max_overflow: int | None = None
+    database_pool_timeout: float | None = None
+    database_pool_recycle: int | None = None
+    database_pool_pre_ping: bool | None = None
+    database_null_pool: bool | None = None
+    database_statement_cache_size: int | None = None
+    database_query_cache_size: int | None = None
+    database_replica_urls: List[str] = []
+    database_replica_strategy: Literal["round_robin", "least_connections"] = "round_robin"
+    database_slow_query_seconds: float | None = 0.5
+    database_pool_budget: int | None = None  # connections shared by all server workers and engines
 
 class TokenSettings(CommonSettings):
     secret_key: str
     token_algorithm: str
     token_expires: int
     token_type: str
+    token_cache_size: int = 0
+    token_keys_dir: str | None = None
+    token_active_kid: str | None = None
+    access_token_expire_minutes: int = 15
+    refresh_token_expire_minutes: int = 60 * 24 * 14
+    token_revocation_redis_url: str | None = None
+
+class HashingSettings(CommonSettings):
+    password_hash_rounds: int = Field(12, ge=4, le=31)
+    password_hash_workers: int = 4
+    password_hash_max_queue: int = 64
+    password_hash_use_processes: bool = False
 
 class CelerySettings(CommonSettings):
     celery_app_name: str
     celery_broker_url: str
     celery_backend_url: str
+    celery_prefetch_multiplier: int = 1
+    celery_acks_late: bool = True
+    celery_task_always_eager: bool = False  # run tasks in-process, e.g. with memory:// for local benchmarks
+    celery_job_tasks: List[str] = []  # task names the /jobs API may enqueue
+    celery_job_result_cache_size: int = 1024
+    celery_job_result_cache_ttl: int = 300
+
+class CacheSettings(CommonSettings):
+    cache_redis_url: str | None = None
+    cache_ttl: int = 60
+    cache_local_ttl: int = 5
+    cache_local_max_size: int = 1024
+
+class LoggingSettings(CommonSettings):
+    log_dir: str = "logs"
+    log_to_file: bool = True
+    log_queue: bool = True
+    log_format: Literal["text", "json"] = "text"
+    log_rotation: Literal["size", "time"] = "size"
+    log_max_bytes: int = 10 * 1024 * 1024
+    log_rotation_when: str = "midnight"
+    log_backup_count: int = 5
+    log_debug_sample_rate: float = Field(1.0, ge=0.0, le=1.0)
+
+class ServerSettings(CommonSettings):
+    server_mode: Literal["development", "production"] = "development"
+    server_host: str = "0.0.0.0"
+    server_port: int = 8000
+    server_workers: int | None = None  # production default: one per CPU core
+    server_loop: Literal["auto", "asyncio", "uvloop"] = "auto"
+    server_http: Literal["auto", "h11", "httptools"] = "auto"
+    server_graceful_timeout: int = 30
+    server_keep_alive: int = 5
+    server_max_requests: int | None = None
 
 class Settings:
-    database_settings: DataBaseSettings = DataBaseSettings()
-    auth_settings: TokenSettings = TokenSettings()
-    celery_settings: CelerySettings = CelerySettings()
+    """Each group is read from the environment on first access, then reused."""
+
+    @cached_property
+    def database_settings(self) -> DataBaseSettings:
+        return DataBaseSettings()
+
+    @cached_property
+    def auth_settings(self) -> TokenSettings:
+        return TokenSettings()
+
+    @cached_property
+    def hashing_settings(self) -> HashingSettings:
+        return HashingSettings()
+
+    @cached_property
+    def celery_settings(self) -> CelerySettings:
+        return CelerySettings()
+
+    @cached_property
+    def cache_settings(self) -> CacheSettings:
+        return CacheSettings()
+
+    @cached_property
+    def logging_settings(self) -> LoggingSettings:
+        return LoggingSettings()
+
+    @cached_property
+    def server_settings(self) -> ServerSettings:
+        return ServerSettings()
+
 
-settings = Settings()
+@lru_cache
+def get_settings() -> Settings:
+    return Settings()
@@ -1,9 +1,28 @@
+from datetime import date, datetime
+from operator import attrgetter
+from typing import Any, Dict, Tuple, Callable
+
+from sqlalchemy import Column
 from sqlalchemy.orm import (
     mapped_column, Mapped,
     DeclarativeBase, declared_attr
 )
 
 
+def coerce_column_value(column: Column, value: Any) -> Any:
+    """Restore a JSON-decoded value to the python type of the column."""
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return value
+
+    if value is None or isinstance(value, python_type):
+        return value
+    if python_type in (datetime, date):
+        return python_type.fromisoformat(value)
+    return python_type(value)
+
+
 class Base(DeclarativeBase):
     __abstract__ = True
 
@@ -12,10 +31,29 @@ class Base(DeclarativeBase):
         return f"{cls.__name__.lower()}s"
 
     def to_dict(self) -> dict:
-        return {
-            column.name: getattr(self, column.name)
-            for column in self.__table__.columns
-        }
+        names, getter = self._column_accessor()
+        return dict(zip(names, getter(self)))
+
+    @classmethod
+    def _column_accessor(cls) -> Tuple[Tuple[str, ...], Callable[[Any], Tuple[Any, ...]]]:
+        """Column names and a single attrgetter for them, built once per model class."""
+        accessor = cls.__dict__.get("_column_accessor_cache")
+        if accessor is None:
+            names = tuple(column.name for column in cls.__table__.columns)
+            getter = attrgetter(*names)
+            if len(names) == 1:  # attrgetter returns a bare value for a single name
+                getter = lambda obj, _get=getter: (_get(obj),)
+            accessor = (names, getter)
+            cls._column_accessor_cache = accessor
+        return accessor
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]):
+        columns = cls.__table__.columns
+        return cls(**{
+            name: coerce_column_value(columns[name], value)
+            for name, value in data.items()
+        })
 
     id: Mapped[int] = mapped_column(
         primary_key=True, autoincrement=True
@@ -1,29 +1,62 @@
-from typing import Generic, Type, Sequence, Dict, Any
+import json
+from typing import Generic, Type, Sequence, Dict, Any, List, Iterator, AsyncIterator, Callable, Tuple
 
-from sqlalchemy import select, Result, func, exists, Select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import (
+    select, insert, update, delete, Result, func, exists, Select, tuple_, ColumnElement, text,
+    Executable, lambda_stmt, TextClause,
+)
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import CompileError, IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession, AsyncResult
+from sqlalchemy.orm import InstrumentedAttribute
 
+from src.database.base import coerce_column_value
+from src.database.instrumentation import track_operation, operation_label
 from src.logs import setup_logger
+from src.pagination import (
+    CursorCodec, CursorPagination, CursorPaginationParams, Pagination, PaginationParams
+)
 from src.types import ID, ModelType
-from src.exceptions import NotFoundRecord
+from src.exceptions import NotFoundRecord, InvalidCursorException
 
 
 logger = setup_logger(__name__)
 
+_BASE_STATEMENTS: Dict[Tuple[type, str], Any] = {}
+
 class BaseRepository(Generic[ModelType]):
+    DIRECT_WRITES = False  # update/delete by id without a prior SELECT
+    BULK_CHUNK_SIZE = 1000
+    CACHED_STATEMENTS = False  # reuse cached statements for hot reads, see benchmarks/statement_cache.py
+    STREAM_BATCH_SIZE = 1000
+    UPSERT_DIALECTS = {
+        "postgresql": postgresql.insert,
+        "sqlite": sqlite.insert,
+    }
+
     def __init__(self, session: AsyncSession, model: Type[ModelType]) -> None:
         self.session = session
         self.model = model
 
+    @track_operation
     async def get_by_id(self, id_: ID) -> ModelType:
         logger.debug(f"start get by id: {id_}") # example for use logger
-        stmt = select(self.model).where(self.model.id == id_)
+        stmt = self._get_by_id_stmt(id_)
         record_or_none: ModelType = await self._get_scalar(stmt=stmt)
 
         self._check_exists_element(record_or_none)
 
         return record_or_none
 
+    @track_operation
+    async def get_by_ids(self, ids: Sequence[ID], *, chunk_size: int | None = None) -> List[ModelType]:
+        """Records for the ids that exist, in no particular order; missing ids are simply absent."""
+        records: List[ModelType] = []
+        for chunk in self._chunks(ids, chunk_size):
+            records.extend(await self._get_scalars(stmt=select(self.model).where(self.model.id.in_(chunk))))
+        return records
+
+    @track_operation
     async def get_all(self, limit: int = 10, offset: int = 0) -> Sequence[ModelType]:
         stmt = select(self.model).limit(limit).offset(offset)
         return await self._get_scalars(stmt=stmt)
@@ -33,29 +66,438 @@ class BaseRepository(Generic[ModelType]):
         self.session.add(obj)
         return obj
 
+    @track_operation
+    async def create_if_absent(
+            self, obj_in: Dict[str, Any], *, index_elements: Sequence[str] = ("id",)
+    ) -> ModelType | None:
+        """INSERT ... ON CONFLICT DO NOTHING RETURNING *, ``None`` when the row already exists.
+
+        ``index_elements`` must match a unique index. Dialects without ON CONFLICT
+        or RETURNING insert inside a SAVEPOINT; an IntegrityError counts as a conflict
+        only when a row with the same ``index_elements`` exists, otherwise it is raised.
+        """
+        dialect = self.session.get_bind().dialect
+        if dialect.name not in self.UPSERT_DIALECTS or not dialect.insert_returning:
+            return await self._create_in_savepoint(obj_in, index_elements)
+
+        stmt = (
+            self._upsert_factory()(self.model)
+            .values(**obj_in)
+            .on_conflict_do_nothing(index_elements=index_elements)
+            .returning(self.model)
+        )
+        result = await self.session.scalars(stmt, execution_options={"populate_existing": True})
+        return result.first()
+
+    @track_operation
+    async def get_or_create(
+            self, obj_in: Dict[str, Any], *, index_elements: Sequence[str] = ("id",)
+    ) -> Tuple[ModelType, bool]:
+        """The record with ``obj_in``'s ``index_elements`` values and whether it was just created."""
+        record = await self.create_if_absent(obj_in, index_elements=index_elements)
+        if record is not None:
+            return record, True
+
+        record = await self.first(*self._index_conditions(obj_in, index_elements))
+        self._check_exists_element(record)  # deleted again between the two statements
+        return record, False
+
+    @track_operation
     async def update(self, id_: ID, obj_in: Dict[str, Any]) -> ModelType:
+        if self.DIRECT_WRITES:
+            return await self.update_by_id(id_, obj_in)
         instance = await self.get_by_id(id_)
         return self._update_instance(instance, obj_in)
 
+    @track_operation
     async def delete(self, id_: ID) -> None:
+        if self.DIRECT_WRITES:
+            return await self.delete_by_id(id_)
         obj = await self.get_by_id(id_)
         await self.session.delete(obj)
 
+    @track_operation
+    async def update_by_id(self, id_: ID, obj_in: Dict[str, Any]) -> ModelType:
+        """UPDATE ... WHERE id = :id RETURNING *, one round trip instead of SELECT + UPDATE."""
+        if not obj_in:
+            return await self.get_by_id(id_)
+
+        stmt = (
+            update(self.model)
+            .where(self.model.id == id_)
+            .values(**obj_in)
+            .returning(self.model)
+            .execution_options(populate_existing=True, synchronize_session=False)
+        )
+        result: Result = await self.session.execute(stmt)
+        record_or_none: ModelType | None = result.scalar_one_or_none()
+
+        self._check_exists_element(record_or_none)
+
+        return record_or_none
+
+    @track_operation
+    async def delete_by_id(self, id_: ID) -> None:
+        """DELETE ... WHERE id = :id, the affected rowcount decides NotFoundRecord."""
+        stmt = delete(self.model).where(self.model.id == id_)
+        result: Result = await self.session.execute(stmt)
+
+        if not result.rowcount:
+            raise NotFoundRecord(self.model.__name__)
+
+    @track_operation
+    async def bulk_create(
+            self,
+            objs_in: Sequence[Dict[str, Any]],
+            *,
+            chunk_size: int | None = None,
+            returning: bool = False,
+    ) -> Sequence[ModelType] | None:
+        stmt = insert(self.model)
+        if not returning:
+            for chunk in self._chunks(objs_in, chunk_size):
+                await self.session.execute(stmt, chunk)
+            return None
+
+        records: List[ModelType] = []
+        for chunk in self._chunks(objs_in, chunk_size):
+            records.extend(
+                await self.session.scalars(stmt.returning(self.model, sort_by_parameter_order=True), chunk)
+            )
+        return records
+
+    @track_operation
+    async def bulk_update(self, objs_in: Sequence[Dict[str, Any]], *, chunk_size: int | None = None) -> None:
+        """Update rows by primary key, every dict must contain ``id``."""
+        for chunk in self._chunks(objs_in, chunk_size):
+            await self.session.execute(update(self.model), chunk)
+
+    @track_operation
+    async def bulk_delete(self, ids: Sequence[ID], *, chunk_size: int | None = None) -> int:
+        deleted = 0
+        for chunk in self._chunks(ids, chunk_size):
+            stmt = delete(self.model).where(self.model.id.in_(chunk))
+            result: Result = await self.session.execute(stmt)
+            deleted += result.rowcount
+        return deleted
+
+    @track_operation
+    async def upsert(
+            self,
+            objs_in: Sequence[Dict[str, Any]],
+            *,
+            index_elements: Sequence[str] = ("id",),
+            update_fields: Sequence[str] | None = None,
+            chunk_size: int | None = None,
+            returning: bool = False,
+    ) -> Sequence[ModelType] | None:
+        """INSERT ... ON CONFLICT DO UPDATE, falls back to DO NOTHING when nothing to update.
+
+        Rows are sent as one multi-row VALUES per chunk, so they must share the same keys.
+        With ``returning`` the records come back in input order (minus rows skipped
+        by DO NOTHING).
+        """
+        records: List[ModelType] = []
+        insert_factory = self._upsert_factory()
+
+        for chunk in self._chunks(objs_in, chunk_size):
+            stmt = insert_factory(self.model)
+            fields = update_fields if update_fields is not None else [
+                key for key in chunk[0] if key not in index_elements
+            ]
+
+            if fields:
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=index_elements,
+                    set_={field: stmt.excluded[field] for field in fields},
+                )
+            else:
+                stmt = stmt.on_conflict_do_nothing(index_elements=index_elements)
+
+            if not returning:
+                await self.session.execute(stmt.values(chunk))
+                continue
+
+            # executemany form, insertmanyvalues still batches it but can restore the parameter order
+            result = await self.session.scalars(
+                stmt.returning(self.model, sort_by_parameter_order=True),
+                chunk,
+                execution_options={"populate_existing": True},
+            )
+            records.extend(result)
+
+        return records if returning else None
+
+    @track_operation
     async def exists(self, *conditions) -> bool:
-        stmt = select(exists().where(*conditions))
+        stmt = self._exists_stmt(conditions)
         return bool(await self._get_scalar(stmt=stmt))
 
+    @track_operation
     async def count(self, *conditions) -> int:
-        stmt = select(func.count()).where(*conditions)
+        stmt = self._count_stmt(conditions)
         return await self._get_scalar(stmt=stmt) or 0
 
+    @track_operation
+    async def estimated_count(self, *conditions) -> int:
+        """Planner estimate on PostgreSQL (pg_class.reltuples / EXPLAIN), exact count elsewhere."""
+        if self.session.get_bind().dialect.name != "postgresql":
+            return await self.count(*conditions)
+
+        if conditions:
+            try:
+                estimate = await self._explain_rows(select(self.model.id).where(*conditions))
+            except CompileError:  # a bound value type without a literal renderer
+                return await self.count(*conditions)
+        else:
+            stmt = text("SELECT reltuples::bigint FROM pg_class WHERE oid = CAST(:table AS regclass)")
+            result: Result = await self.session.execute(stmt, {"table": self.model.__tablename__})
+            estimate = result.scalar()
+
+        if estimate is None or estimate < 0:  # table was never analyzed
+            return await self.count(*conditions)
+        return int(estimate)
+
+    @track_operation
+    async def paginate(
+            self, params: PaginationParams, *conditions, estimated: bool = False
+    ) -> Pagination[ModelType]:
+        if estimated:
+            items = await self.get_by_conditions(*conditions, offset=params.offset, limit=params.limit)
+            return Pagination(count=await self.estimated_count(*conditions), items=list(items))
+
+        stmt = (
+            select(self.model, func.count().over().label("total_count"))
+            .where(*conditions)
+            .offset(params.offset)
+            .limit(params.limit)
+        )
+        result: Result = await self.session.execute(stmt)
+        rows = result.all()
+
+        if rows:
+            count = rows[0].total_count
+        else:  # the window has no rows to ride on past the last page
+            count = await self.count(*conditions) if params.offset or not params.limit else 0
+
+        return Pagination(count=count, items=[row[0] for row in rows])
+
+    @track_operation
     async def get_by_conditions(self, *conditions, offset: int = 0, limit: int = 10) -> Sequence[ModelType]:
-        stmt = select(self.model).where(*conditions).offset(offset).limit(limit)
+        stmt = self._get_by_conditions_stmt(conditions, offset, limit)
         return await self._get_scalars(stmt=stmt)
 
+    @track_operation
+    async def get_rows(self, *conditions, offset: int = 0, limit: int = 10) -> List[Dict[str, Any]]:
+        """Plain column dicts straight from the driver rows, no ORM instances or identity map."""
+        stmt = select(*self.model.__table__.columns).where(*conditions).offset(offset).limit(limit)
+        result: Result = await self.session.execute(stmt)
+        return [dict(row) for row in result.mappings()]
+
+    async def stream(
+            self,
+            *conditions,
+            batch_size: int | None = None,
+            order_by: Sequence[InstrumentedAttribute] = (),
+    ) -> AsyncIterator[ModelType]:
+        """Yield every matching record, fetched ``batch_size`` rows at a time over a server-side cursor.
+
+        The session holds its connection until the generator is exhausted or closed.
+        """
+        stmt = select(self.model).where(*conditions).order_by(*order_by)
+        result = await self._open_stream(stmt, "stream", batch_size)
+        try:
+            async for partition in result.scalars().partitions():
+                for record in partition:
+                    yield record
+        finally:
+            await result.close()
+
+    async def stream_rows(
+            self,
+            *conditions,
+            batch_size: int | None = None,
+            order_by: Sequence[InstrumentedAttribute] = (),
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Like ``stream`` but yields plain column dicts, memory stays flat for exports of any size."""
+        stmt = select(*self.model.__table__.columns).where(*conditions).order_by(*order_by)
+        result = await self._open_stream(stmt, "stream_rows", batch_size)
+        try:
+            async for partition in result.mappings().partitions():
+                for row in partition:
+                    yield dict(row)
+        finally:
+            await result.close()
+
+    @track_operation
     async def get_one_by_conditions(self, *conditions) -> ModelType | None:
-        records = await self.get_by_conditions(*conditions, offset=0, limit=1)
-        return records[0] if records else None
+        return await self.first(*conditions)
+
+    @track_operation
+    async def first(self, *conditions, order_by: Sequence[InstrumentedAttribute] = ()) -> ModelType | None:
+        stmt = select(self.model).where(*conditions).order_by(*order_by).limit(1)
+        result = await self.session.scalars(stmt)
+        return result.first()
+
+    @track_operation
+    async def get_by_cursor(
+            self,
+            *conditions,
+            after: Sequence[Any] | None = None,
+            limit: int = 10,
+            order_by: Sequence[InstrumentedAttribute] = (),
+            descending: bool = False,
+    ) -> Sequence[ModelType]:
+        columns = self._keyset_columns(order_by)
+        stmt = select(self.model).where(*conditions)
+
+        if after is not None:
+            stmt = stmt.where(self._keyset_condition(columns, after, descending))
+
+        ordering = [column.desc() if descending else column.asc() for column in columns]
+        stmt = stmt.order_by(*ordering).limit(limit)
+        return await self._get_scalars(stmt=stmt)
+
+    @track_operation
+    async def paginate_by_cursor(
+            self,
+            params: CursorPaginationParams,
+            codec: CursorCodec,
+            *conditions,
+            order_by: Sequence[InstrumentedAttribute] = (),
+            descending: bool = False,
+    ) -> CursorPagination[ModelType]:
+        scope = self.cursor_scope(order_by, descending)
+        after = codec.decode(params.cursor, scope) if params.cursor else None
+        records = await self.get_by_cursor(
+            *conditions, after=after, limit=params.limit + 1,
+            order_by=order_by, descending=descending,
+        )
+
+        items = list(records[:params.limit])
+        next_cursor = None
+        if len(records) > params.limit and items:
+            next_cursor = codec.encode(self._keyset_values(items[-1], order_by), scope)
+
+        return CursorPagination(next_cursor=next_cursor, items=items)
+
+    def cursor_scope(self, order_by: Sequence[InstrumentedAttribute] = (), descending: bool = False) -> str:
+        """Ordering a cursor is signed for, so it can't be replayed against another one."""
+        keys = ",".join(column.key for column in self._keyset_columns(order_by))
+        return f"{self.model.__tablename__}:{keys}:{'desc' if descending else 'asc'}"
+
+    def _get_by_id_stmt(self, id_: ID) -> Executable:
+        model = self.model
+        if self.CACHED_STATEMENTS:
+            return lambda_stmt(lambda: select(model).where(model.id == id_))
+        return select(model).where(model.id == id_)
+
+    def _exists_stmt(self, conditions: Sequence[ColumnElement[bool]]) -> Executable:
+        if self.CACHED_STATEMENTS:
+            return select(self._base_stmt("exists", lambda: exists().select_from(self.model)).where(*conditions))
+        return select(exists().select_from(self.model).where(*conditions))
+
+    def _count_stmt(self, conditions: Sequence[ColumnElement[bool]]) -> Executable:
+        if self.CACHED_STATEMENTS:
+            return self._base_stmt("count", lambda: select(func.count()).select_from(self.model)).where(*conditions)
+        return select(func.count()).select_from(self.model).where(*conditions)
+
+    def _get_by_conditions_stmt(
+            self, conditions: Sequence[ColumnElement[bool]], offset: int, limit: int
+    ) -> Executable:
+        if self.CACHED_STATEMENTS:
+            stmt = self._base_stmt("select", lambda: select(self.model))
+        else:
+            stmt = select(self.model)
+        return stmt.where(*conditions).offset(offset).limit(limit)
+
+    def _base_stmt(self, name: str, build: Callable[[], Any]) -> Any:
+        """Statement prefix built once per model; the conditions vary, so they can't go in a lambda."""
+        key = (self.model, name)
+        stmt = _BASE_STATEMENTS.get(key)
+        if stmt is None:
+            stmt = _BASE_STATEMENTS[key] = build()
+        return stmt
+
+    def _keyset_columns(self, order_by: Sequence[InstrumentedAttribute]) -> List[InstrumentedAttribute]:
+        for column in order_by:
+            if getattr(column.expression, "nullable", False):  # a tuple comparison with NULL is never true
+                raise ValueError(f"cannot paginate by nullable column {column.key}")
+        columns = list(order_by)
+        if self.model.id.key not in {column.key for column in columns}:
+            columns.append(self.model.id)  # unique tiebreaker keeps the keyset total
+        return columns
+
+    def _keyset_values(self, record: ModelType, order_by: Sequence[InstrumentedAttribute]) -> List[Any]:
+        return [getattr(record, column.key) for column in self._keyset_columns(order_by)]
+
+    def _keyset_condition(
+            self, columns: List[InstrumentedAttribute], values: Sequence[Any], descending: bool
+    ) -> ColumnElement[bool]:
+        if len(values) != len(columns):
+            raise InvalidCursorException()
+
+        values = [self._coerce_cursor_value(column, value) for column, value in zip(columns, values)]
+        keyset, bound = tuple_(*columns), tuple_(*values)
+        return keyset < bound if descending else keyset > bound
+
+    @staticmethod
+    def _coerce_cursor_value(column: InstrumentedAttribute, value: Any) -> Any:
+        try:
+            return coerce_column_value(column, value)
+        except (TypeError, ValueError):
+            raise InvalidCursorException()
+
+    async def _explain_rows(self, stmt: Select) -> int | None:
+        result: Result = await self.session.execute(self._explain_stmt(stmt))
+        plan = result.scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return plan[0]["Plan"]["Plan Rows"] if plan else None
+
+    def _explain_stmt(self, stmt: Select) -> TextClause:
+        compiled = stmt.compile(
+            dialect=self.session.get_bind().dialect, compile_kwargs={"literal_binds": True}
+        )
+        # escape colons so literal values like 'see :note' are not parsed as bind parameters again
+        return text(f"EXPLAIN (FORMAT JSON) {compiled}".replace(":", "\\:"))
+
+    async def _open_stream(self, stmt: Select, operation: str, batch_size: int | None) -> AsyncResult:
+        batch_size = batch_size or self.STREAM_BATCH_SIZE
+        with operation_label(f"{self.model.__name__}.{operation}"):
+            return await self.session.stream(stmt.execution_options(yield_per=batch_size))
+
+    async def _create_in_savepoint(
+            self, obj_in: Dict[str, Any], index_elements: Sequence[str]
+    ) -> ModelType | None:
+        try:
+            async with self.session.begin_nested():
+                result: Result = await self.session.execute(insert(self.model).values(**obj_in))
+        except IntegrityError:
+            if not all(field in obj_in for field in index_elements):
+                raise
+            if not await self.exists(*self._index_conditions(obj_in, index_elements)):
+                raise  # NOT NULL, foreign key, check, ... rather than a conflict on index_elements
+            return None
+        return await self.session.get(self.model, result.inserted_primary_key[0])
+
+    def _index_conditions(
+            self, obj_in: Dict[str, Any], index_elements: Sequence[str]
+    ) -> List[ColumnElement[bool]]:
+        return [getattr(self.model, field) == obj_in[field] for field in index_elements]
+
+    def _upsert_factory(self):
+        dialect_name = self.session.get_bind().dialect.name
+        try:
+            return self.UPSERT_DIALECTS[dialect_name]
+        except KeyError:
+            raise NotImplementedError(f"upsert is not supported for dialect {dialect_name}")
+
+    def _chunks(self, items: Sequence[Any], chunk_size: int | None) -> Iterator[List[Any]]:
+        chunk_size = chunk_size or self.BULK_CHUNK_SIZE
+        items = list(items)
+        for start in range(0, len(items), chunk_size):
+            yield items[start:start + chunk_size]
 
     async def _get_scalar(self, stmt: Select) -> Any:
         result: Result = await self.session.execute(stmt)
@@ -0,0 +1,291 @@
+import asyncio
+import hashlib
+import time
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, Iterable, Sequence, Set, Tuple, Type
+
+from sqlalchemy import event, select, Select
+from sqlalchemy.exc import CompileError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, SessionTransaction, make_transient_to_detached
+from sqlalchemy.orm.util import identity_key
+from sqlalchemy.util import await_only
+
+from src.cache.cache_backend import CacheBackend
+from src.cache.memory_cache_backend import MemoryCacheBackend
+from src.cache.redis_cache_backend import RedisCacheBackend
+from src.cache.tiered_cache_backend import TieredCacheBackend
+from src.config import CacheSettings
+from src.database.base_repository import BaseRepository
+from src.logs import setup_logger
+from src.types import ID, ModelType
+
+
+logger = setup_logger(__name__)
+
+_LOAD_FAILED = object()
+_PENDING_INVALIDATIONS = "repository_cache_pending"
+
+
+class RepositoryCache:
+    """Process-wide cache state shared by the per-request CachingRepository instances.
+
+    Keys embed a per-table generation: ``rows`` scopes records cached by id,
+    ``queries`` scopes ``exists``/``count`` results. Bumping a generation orphans
+    every key built with the old one, the backend TTL cleans them up.
+
+    Backend errors never fail a request: a failed get or set is a cache miss and
+    a failed invalidation is logged, leaving stale entries to the TTL.
+    """
+
+    ROWS = "rows"
+    QUERIES = "queries"
+
+    def __init__(self, backend: CacheBackend, ttl: int = 60, prefix: str = "repository"):
+        self.backend = backend
+        self.ttl = ttl
+        self.prefix = prefix
+        self.hits = 0
+        self.misses = 0
+        self._in_flight: Dict[str, asyncio.Future] = {}
+
+    async def get_or_load(self, key: str, loader: Callable[[], Awaitable[Any]]) -> Any | None:
+        value = await self._get(key)
+        if value is not None:
+            self.hits += 1
+            return value
+        self.misses += 1
+
+        in_flight = self._in_flight.get(key)
+        if in_flight is not None:  # single-flight: wait for the load already running
+            value = await asyncio.shield(in_flight)
+            return await loader() if value is _LOAD_FAILED else value
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        result = _LOAD_FAILED  # waiters run their own loader when this one raises
+        try:
+            result = value = await loader()
+            if value is not None:
+                await self._set(key, value, self.ttl)
+        finally:
+            del self._in_flight[key]
+            future.set_result(result)
+        return value
+
+    async def generation(self, table: str, scope: str) -> int:
+        return await self._get(self._generation_key(table, scope)) or 0
+
+    async def bump(self, table: str, *scopes: str) -> None:
+        for scope in scopes:
+            await self.backend.set(self._generation_key(table, scope), time.time_ns())
+
+    async def invalidate(self, table: str, *ids: ID, all_rows: bool = False) -> None:
+        """Drop the cached rows for ``ids`` and orphan cached queries (and every row with ``all_rows``)."""
+        try:
+            if ids:
+                generation = await self.generation(table, self.ROWS)
+                await self.backend.delete(*(self.key(table, generation, "id", id_) for id_ in ids))
+            await self.bump(table, *((self.ROWS, self.QUERIES) if all_rows else (self.QUERIES,)))
+        except Exception as exc:
+            logger.error(f"cache invalidation for {table} failed: {exc!r}")
+
+    def key(self, table: str, generation: int, *parts: Any) -> str:
+        return ":".join(str(part) for part in (self.prefix, table, generation, *parts))
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "in_flight": len(self._in_flight)}
+
+    def _generation_key(self, table: str, scope: str) -> str:
+        return f"{self.prefix}:{table}:generation:{scope}"
+
+    async def _get(self, key: str) -> Any | None:
+        try:
+            return await self.backend.get(key)
+        except Exception as exc:
+            logger.warning(f"cache get {key} failed: {exc!r}")
+            return None
+
+    async def _set(self, key: str, value: Any, ttl: int) -> None:
+        try:
+            await self.backend.set(key, value, ttl)
+        except Exception as exc:
+            logger.warning(f"cache set {key} failed: {exc!r}")
+
+
+def _pending_invalidations(session: Session) -> Dict[Tuple[RepositoryCache, str], Tuple[Set[ID], bool]]:
+    pending = session.info.get(_PENDING_INVALIDATIONS)
+    if pending is None:
+        pending = session.info[_PENDING_INVALIDATIONS] = {}
+        event.listen(session, "after_commit", _invalidate_after_commit)
+        event.listen(session, "after_soft_rollback", _discard_pending_invalidations)
+    return pending
+
+
+def _invalidate_after_commit(session: Session) -> None:
+    pending = session.info[_PENDING_INVALIDATIONS]
+    invalidations = list(pending.items())
+    pending.clear()
+    for (cache, table), (ids, all_rows) in invalidations:
+        await_only(cache.invalidate(table, *ids, all_rows=all_rows))  # AsyncSession commits inside a greenlet
+
+
+def _discard_pending_invalidations(session: Session, previous_transaction: SessionTransaction) -> None:
+    if previous_transaction.parent is None:  # a rolled back savepoint keeps the outer writes
+        session.info[_PENDING_INVALIDATIONS].clear()
+
+
+class CachingRepository(BaseRepository[ModelType]):
+    """Read-through cache for get_by_id/exists/count.
+
+    Writes invalidate when they are issued and again once the session commits,
+    so entries a concurrent reader cached from the old rows in between are
+    dropped too. Until then reads in the writing session bypass the cache, its
+    uncommitted rows are never shared with other sessions.
+    """
+
+    def __init__(self, session: AsyncSession, model: Type[ModelType], cache: RepositoryCache) -> None:
+        super().__init__(session, model)
+        self.cache = cache
+
+    async def get_by_id(self, id_: ID) -> ModelType:
+        record = self._get_identity(id_)
+        if record is not None:
+            return record
+        if self._has_pending_writes():
+            return await super().get_by_id(id_)
+
+        key = await self._id_key(id_)
+        data = await self.cache.get_or_load(key, partial(self._load_dict, id_))
+
+        self._check_exists_element(data)
+
+        return self._attach(data)
+
+    async def exists(self, *conditions) -> bool:
+        key = await self._query_key("exists", select(self.model.id).where(*conditions))
+        if key is None or self._has_pending_writes():
+            return await super().exists(*conditions)
+        return await self.cache.get_or_load(key, partial(super().exists, *conditions))
+
+    async def count(self, *conditions) -> int:
+        key = await self._query_key("count", select(self.model.id).where(*conditions))
+        if key is None or self._has_pending_writes():
+            return await super().count(*conditions)
+        return await self.cache.get_or_load(key, partial(super().count, *conditions))
+
+    async def create(self, obj_in: Dict[str, Any]) -> ModelType:
+        record = await super().create(obj_in)
+        await self.invalidate()
+        return record
+
+    async def create_if_absent(self, obj_in: Dict[str, Any], **kwargs) -> ModelType | None:
+        record = await super().create_if_absent(obj_in, **kwargs)
+        if record is not None:
+            await self.invalidate()
+        return record
+
+    async def update(self, id_: ID, obj_in: Dict[str, Any]) -> ModelType:
+        if self.DIRECT_WRITES:
+            return await self.update_by_id(id_, obj_in)
+        record = await super().update(id_, obj_in)
+        await self.invalidate(id_)
+        return record
+
+    async def delete(self, id_: ID) -> None:
+        if self.DIRECT_WRITES:
+            return await self.delete_by_id(id_)
+        await super().delete(id_)
+        await self.invalidate(id_)
+
+    async def update_by_id(self, id_: ID, obj_in: Dict[str, Any]) -> ModelType:
+        record = await super().update_by_id(id_, obj_in)
+        await self.invalidate(id_)
+        return record
+
+    async def delete_by_id(self, id_: ID) -> None:
+        await super().delete_by_id(id_)
+        await self.invalidate(id_)
+
+    async def bulk_create(self, objs_in: Sequence[Dict[str, Any]], **kwargs) -> Sequence[ModelType] | None:
+        records = await super().bulk_create(objs_in, **kwargs)
+        await self.invalidate()
+        return records
+
+    async def bulk_update(self, objs_in: Sequence[Dict[str, Any]], **kwargs) -> None:
+        await super().bulk_update(objs_in, **kwargs)
+        await self.invalidate(*(obj_in["id"] for obj_in in objs_in))
+
+    async def bulk_delete(self, ids: Sequence[ID], **kwargs) -> int:
+        deleted = await super().bulk_delete(ids, **kwargs)
+        await self.invalidate(*ids)
+        return deleted
+
+    async def upsert(self, objs_in: Sequence[Dict[str, Any]], **kwargs) -> Sequence[ModelType] | None:
+        records = await super().upsert(objs_in, **kwargs)
+
+        if tuple(kwargs.get("index_elements", ("id",))) == ("id",):
+            await self.invalidate(*(obj_in["id"] for obj_in in objs_in if "id" in obj_in))
+        else:  # conflicts on other keys can touch rows we cannot name
+            await self.invalidate(all_rows=True)
+
+        return records
+
+    async def invalidate(self, *ids: ID, all_rows: bool = False) -> None:
+        await self.cache.invalidate(self._table, *ids, all_rows=all_rows)
+        self._defer_invalidation(ids, all_rows)
+
+    def _defer_invalidation(self, ids: Iterable[ID], all_rows: bool) -> None:
+        pending = _pending_invalidations(self.session.sync_session)
+        pending_ids, pending_all_rows = pending.get((self.cache, self._table), (set(), False))
+        pending[(self.cache, self._table)] = (pending_ids | set(ids), pending_all_rows or all_rows)
+
+    def _has_pending_writes(self) -> bool:
+        return (self.cache, self._table) in self.session.sync_session.info.get(_PENDING_INVALIDATIONS, {})
+
+    async def _load_dict(self, id_: ID) -> Dict[str, Any] | None:
+        stmt = select(self.model).where(self.model.id == id_)
+        record: ModelType | None = await self._get_scalar(stmt=stmt)
+        return record.to_dict() if record is not None else None
+
+    def _attach(self, data: Dict[str, Any]) -> ModelType:
+        record = self._get_identity(data["id"])
+        if record is not None:  # loaded by this session while filling the cache
+            return record
+
+        record = self.model.from_dict(data)
+        make_transient_to_detached(record)
+        self.session.add(record)
+        return record
+
+    def _get_identity(self, id_: ID) -> ModelType | None:
+        return self.session.identity_map.get(identity_key(self.model, id_))
+
+    async def _id_key(self, id_: ID) -> str:
+        generation = await self.cache.generation(self._table, RepositoryCache.ROWS)
+        return self.cache.key(self._table, generation, "id", id_)
+
+    async def _query_key(self, kind: str, stmt: Select) -> str | None:
+        try:
+            compiled = str(stmt.compile(compile_kwargs={"literal_binds": True}))
+        except (CompileError, NotImplementedError):  # conditions that cannot be rendered stay uncached
+            return None
+
+        digest = hashlib.sha1(compiled.encode("utf-8")).hexdigest()
+        generation = await self.cache.generation(self._table, RepositoryCache.QUERIES)
+        return self.cache.key(self._table, generation, kind, digest)
+
+    @property
+    def _table(self) -> str:
+        return self.model.__tablename__
+
+
+def create_repository_cache(cache_settings: CacheSettings) -> RepositoryCache:
+    local_tier = MemoryCacheBackend(
+        max_size=cache_settings.cache_local_max_size, ttl=cache_settings.cache_local_ttl
+    )
+    if not cache_settings.cache_redis_url:
+        return RepositoryCache(local_tier, ttl=cache_settings.cache_ttl)
+
+    redis_tier = RedisCacheBackend.from_url(cache_settings.cache_redis_url)
+    return RepositoryCache(TieredCacheBackend(local_tier, redis_tier), ttl=cache_settings.cache_ttl)
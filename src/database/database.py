@@ -1,8 +1,52 @@
-from typing import AsyncGenerator
+import time
+from functools import lru_cache
+from typing import AsyncGenerator, Any, Dict, Sequence, List, Tuple
 
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, AsyncEngine, create_async_engine, async_sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
 
-from src.config import settings
+from src.config import DataBaseSettings, get_settings
+from src.database.instrumentation import QueryInstrumentation
+from src.database.routing import ReplicaRouter, ReplicaStrategy, RoutingSession
+from src.metrics import Histogram, format_histogram, format_sample
+
+
+ENGINE_PROFILES: Dict[str, Dict[str, Any]] = {
+    "api": {
+        "pool_size": 10, "max_overflow": 20, "pool_timeout": 30,
+        "pool_recycle": 1800, "pool_pre_ping": True,
+    },
+    "celery": {
+        "pool_size": 2, "max_overflow": 2, "pool_timeout": 30,
+        "pool_recycle": 1800, "pool_pre_ping": True,
+    },
+    "tests": {
+        "null_pool": True,
+    },
+}
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that also records how long checkouts wait for a free connection."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self.wait_histogram = Histogram()
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            waited = time.perf_counter() - started
+            self.checkouts += 1
+            self.wait_seconds += waited
+            self.max_wait_seconds = max(self.max_wait_seconds, waited)
+            self.wait_histogram.observe(waited)
 
 
 class DatabaseHelper:
@@ -11,21 +55,174 @@ class DatabaseHelper:
     EXPIRE_ON_COMMIT = False
 
 
-    def __init__(self, *, url: str, echo: bool):
-        self.engine = create_async_engine(url, echo=echo)
+    def __init__(
+            self,
+            *,
+            url: str,
+            echo: bool,
+            profile: str = "api",
+            replica_urls: Sequence[str] = (),
+            replica_strategy: ReplicaStrategy = "round_robin",
+            slow_query_threshold: float | None = None,
+            **engine_options,
+    ):
+        self.engine = create_async_engine(
+            url, echo=echo, **self._build_engine_options(url, profile, engine_options)
+        )
+        self.replica_engines = [
+            create_async_engine(
+                replica_url, echo=echo, **self._build_engine_options(replica_url, profile, engine_options)
+            )
+            for replica_url in replica_urls
+        ]
+
+        self.instrumentation = QueryInstrumentation(slow_query_threshold)
+        for engine in (self.engine, *self.replica_engines):
+            self.instrumentation.attach(engine)
+
+        routing_options = {}
+        if self.replica_engines:
+            routing_options = {
+                "sync_session_class": RoutingSession,
+                "router": ReplicaRouter(self.engine, self.replica_engines, replica_strategy),
+            }
 
         self.session_maker = async_sessionmaker(
             bind=self.engine,
             autocommit=self.AUTOCOMMIT,
             autoflush=self.AUTOFLUSH,
             expire_on_commit=self.EXPIRE_ON_COMMIT,
+            **routing_options,
         )
 
     async def session_depends(self) -> AsyncGenerator[AsyncSession, None]:
         async with self.session_maker() as session:
             yield session
 
-database_helper = DatabaseHelper(
-    url=settings.database_settings.database_url,
-    echo=settings.database_settings.database_echo,
-)
+    async def dispose(self) -> None:
+        """Close pooled connections of every engine, e.g. on application shutdown."""
+        for _, engine in self._engines_by_role():
+            self.instrumentation.detach(engine)
+            await engine.dispose()
+
+    def pool_stats(self) -> Dict[str, Any]:
+        stats = self._pool_stats(self.engine)
+        if self.replica_engines:
+            stats["replicas"] = [self._pool_stats(engine) for engine in self.replica_engines]
+        return stats
+
+    def collect_metrics(self) -> List[str]:
+        pools = [
+            (role, engine.pool) for role, engine in self._engines_by_role()
+            if isinstance(engine.pool, InstrumentedQueuePool)
+        ]
+
+        lines = self.instrumentation.collect()
+        lines.append("# TYPE db_pool_connections gauge")
+        for role, pool in pools:
+            lines.append(format_sample("db_pool_connections", pool.checkedout(), {"pool": role, "state": "checked_out"}))
+            lines.append(format_sample("db_pool_connections", pool.overflow(), {"pool": role, "state": "overflow"}))
+
+        lines.append("# TYPE db_pool_wait_seconds histogram")
+        for role, pool in pools:
+            lines.extend(format_histogram("db_pool_wait_seconds", pool.wait_histogram, {"pool": role}))
+        return lines
+
+    def _engines_by_role(self) -> List[Tuple[str, AsyncEngine]]:
+        return [("primary", self.engine)] + [
+            (f"replica_{index}", engine) for index, engine in enumerate(self.replica_engines)
+        ]
+
+    @staticmethod
+    def _pool_stats(engine: AsyncEngine) -> Dict[str, Any]:
+        pool = engine.pool
+        if not isinstance(pool, InstrumentedQueuePool):
+            return {"pool": pool.__class__.__name__, "status": pool.status()}
+
+        return {
+            "pool": pool.__class__.__name__,
+            "size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": pool.overflow(),
+            "checkouts": pool.checkouts,
+            "wait_seconds": pool.wait_seconds,
+            "max_wait_seconds": pool.max_wait_seconds,
+            "wait": pool.wait_histogram.snapshot(),
+        }
+
+    @staticmethod
+    def _build_engine_options(url: str, profile: str, overrides: Dict[str, Any]) -> Dict[str, Any]:
+        options = {**ENGINE_PROFILES[profile], **{
+            name: value for name, value in overrides.items() if value is not None
+        }}
+        url = make_url(url)
+        engine_options: Dict[str, Any] = {}
+
+        if "query_cache_size" in options:
+            engine_options["query_cache_size"] = options["query_cache_size"]
+        if url.get_backend_name() == "sqlite":  # aiosqlite picks its own pool per database kind
+            return engine_options
+
+        for name in ("pool_recycle", "pool_pre_ping"):
+            if name in options:
+                engine_options[name] = options[name]
+
+        if options.get("null_pool"):  # e.g. behind PgBouncer, which does the pooling
+            engine_options["poolclass"] = NullPool
+        else:
+            engine_options["poolclass"] = InstrumentedQueuePool
+            for name in ("pool_size", "max_overflow", "pool_timeout"):
+                if name in options:
+                    engine_options[name] = options[name]
+
+        if url.get_driver_name() == "asyncpg" and "statement_cache_size" in options:
+            engine_options["connect_args"] = {
+                "statement_cache_size": options["statement_cache_size"],
+                "prepared_statement_cache_size": options["statement_cache_size"],
+            }
+
+        return engine_options
+
+
+def engine_options_from_settings(database_settings: DataBaseSettings) -> Dict[str, Any]:
+    return {
+        "profile": database_settings.database_profile,
+        "pool_size": database_settings.database_pool_size,
+        "max_overflow": database_settings.database_max_overflow,
+        "pool_timeout": database_settings.database_pool_timeout,
+        "pool_recycle": database_settings.database_pool_recycle,
+        "pool_pre_ping": database_settings.database_pool_pre_ping,
+        "null_pool": database_settings.database_null_pool,
+        "statement_cache_size": database_settings.database_statement_cache_size,
+        "query_cache_size": database_settings.database_query_cache_size,
+    }
+
+
+def create_database_helper(database_settings: DataBaseSettings) -> DatabaseHelper:
+    return DatabaseHelper(
+        url=database_settings.database_url,
+        echo=database_settings.database_echo,
+        replica_urls=database_settings.database_replica_urls,
+        replica_strategy=database_settings.database_replica_strategy,
+        slow_query_threshold=database_settings.database_slow_query_seconds,
+        **engine_options_from_settings(database_settings),
+    )
+
+
+@lru_cache
+def get_database_helper() -> DatabaseHelper:
+    """Process-wide helper, engines are created on first use instead of on import."""
+    return create_database_helper(get_settings().database_settings)
+
+
+async def dispose_database_helper() -> None:
+    if get_database_helper.cache_info().currsize:
+        await get_database_helper().dispose()
+        get_database_helper.cache_clear()
+
+
+async def get_session() -> AsyncGenerator[AsyncSession, None]:
+    """FastAPI dependency, a session of the process-wide helper per request."""
+    async with get_database_helper().session_maker() as session:
+        yield session
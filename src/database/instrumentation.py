@@ -0,0 +1,187 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import Dict, Iterator, List, Any, Sequence, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.logs import setup_logger
+from src.metrics import Histogram, format_histogram, format_sample
+from src.timing import record_timing, route_template
+
+
+logger = setup_logger("slow_queries")
+
+current_operation: ContextVar[str | None] = ContextVar("current_operation", default=None)
+_query_counter: ContextVar["QueryCounter | None"] = ContextVar("query_counter", default=None)
+
+UNKNOWN_OPERATION = "unknown"
+ROW_BUCKETS = (0, 1, 10, 100, 1_000, 10_000, 100_000)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100)
+MAX_LOGGED_PARAMETERS = 1000
+
+
+def track_operation(method):
+    """Label the statements issued by a repository method as ``<Model>.<method>``.
+
+    The outermost labelled call wins, so helpers called from another method are
+    accounted to the method the caller actually invoked.
+    """
+
+    @wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        with operation_label(f"{self.model.__name__}.{method.__name__}"):
+            return await method(self, *args, **kwargs)
+
+    return wrapper
+
+
+@contextmanager
+def operation_label(label: str) -> Iterator[None]:
+    """Label statements issued inside the block unless an outer operation already did.
+
+    Async generators can't be wrapped with ``track_operation`` (the label would leak
+    into the caller between yields), they use this around each awaited execute instead.
+    """
+    if current_operation.get() is not None:
+        yield
+        return
+
+    token = current_operation.set(label)
+    try:
+        yield
+    finally:
+        current_operation.reset(token)
+
+
+class QueryCounter:
+    def __init__(self):
+        self.count = 0
+        self.statements: List[str] = []
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryCounter]:
+    """Count statements issued in this context, e.g. per request or to catch N+1 in tests."""
+    counter = QueryCounter()
+    token = _query_counter.set(counter)
+    try:
+        yield counter
+    finally:
+        _query_counter.reset(token)
+
+
+class QueryInstrumentation:
+    """Per-operation latency/row histograms and a slow-query log fed by engine events."""
+
+    def __init__(self, slow_query_threshold: float | None = None):
+        self.slow_query_threshold = slow_query_threshold
+        self.latency: Dict[str, Histogram] = {}
+        self.rows: Dict[str, Histogram] = {}
+        self.slow_queries = 0
+
+    def attach(self, engine: AsyncEngine) -> None:
+        event.listen(engine.sync_engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine.sync_engine, "after_cursor_execute", self._after_cursor_execute)
+
+    def detach(self, engine: AsyncEngine) -> None:
+        event.remove(engine.sync_engine, "before_cursor_execute", self._before_cursor_execute)
+        event.remove(engine.sync_engine, "after_cursor_execute", self._after_cursor_execute)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "operations": {
+                operation: {
+                    "latency": histogram.snapshot(),
+                    "rows": self.rows[operation].snapshot(),
+                }
+                for operation, histogram in self.latency.items()
+            },
+            "slow_queries": self.slow_queries,
+        }
+
+    def collect(self) -> List[str]:
+        lines = ["# TYPE db_query_duration_seconds histogram"]
+        for operation, histogram in self.latency.items():
+            lines.extend(format_histogram("db_query_duration_seconds", histogram, {"operation": operation}))
+        lines.append("# TYPE db_slow_queries_total counter")
+        lines.append(format_sample("db_slow_queries_total", self.slow_queries))
+        return lines
+
+    # the start time lives on the execution context, a failed statement never reaches
+    # after_cursor_execute and would leak anything kept on the pooled connection
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        context._query_started_at = time.perf_counter()
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        elapsed = time.perf_counter() - context._query_started_at
+        operation = current_operation.get() or UNKNOWN_OPERATION
+        record_timing("db", elapsed)
+
+        self.latency.setdefault(operation, Histogram()).observe(elapsed)
+        if cursor.rowcount is not None and cursor.rowcount >= 0:  # drivers report -1 for most SELECTs
+            self.rows.setdefault(operation, Histogram(ROW_BUCKETS)).observe(cursor.rowcount)
+        else:
+            self.rows.setdefault(operation, Histogram(ROW_BUCKETS))
+
+        counter = _query_counter.get()
+        if counter is not None:
+            counter.count += 1
+            counter.statements.append(statement)
+
+        if self.slow_query_threshold is not None and elapsed >= self.slow_query_threshold:
+            self.slow_queries += 1
+            logger.warning(
+                f"slow query ({elapsed * 1000:.1f} ms) in {operation}: {statement} "
+                f"parameters={repr(parameters)[:MAX_LOGGED_PARAMETERS]}"
+            )
+
+
+class RequestQueryMetrics:
+    def __init__(self, buckets: Sequence[float] = QUERY_COUNT_BUCKETS):
+        self.buckets = buckets
+        self.queries: Dict[Tuple[str, str], Histogram] = {}
+
+    def observe(self, method: str, route: str, count: int) -> None:
+        self.queries.setdefault((method, route), Histogram(self.buckets)).observe(count)
+
+    def collect(self) -> List[str]:
+        lines = ["# TYPE http_request_db_queries histogram"]
+        for (method, route), histogram in self.queries.items():
+            lines.extend(format_histogram(
+                "http_request_db_queries", histogram, {"method": method, "route": route}
+            ))
+        return lines
+
+
+request_query_metrics = RequestQueryMetrics()
+
+
+class QueryCountMiddleware:
+    """Runs every HTTP request under ``track_queries``: an ``X-DB-Queries`` response
+    header and a per-route histogram make N+1 patterns visible in tests and in production.
+    """
+
+    def __init__(self, app: ASGIApp, metrics: RequestQueryMetrics = request_query_metrics):
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries() as queries:
+            async def send_with_count(message: Message) -> None:
+                if message["type"] == "http.response.start":  # statements issued while streaming aren't counted
+                    headers = [*message.get("headers", []), (b"x-db-queries", str(queries.count).encode("latin-1"))]
+                    message = {**message, "headers": headers}
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_count)
+            finally:
+                self.metrics.observe(scope["method"], route_template(scope), queries.count)
@@ -0,0 +1,85 @@
+import asyncio
+from typing import Dict, Generic, List, Sequence, Set
+
+from src.database.base_repository import BaseRepository
+from src.exceptions import NotFoundRecord
+from src.types import ID, ModelType
+
+
+class RepositoryLoader(Generic[ModelType]):
+    """Coalesces ``load`` calls made in the same event-loop tick into one ``get_by_ids`` query.
+
+    Results are cached for the loader's lifetime, so create one per request next to the
+    request's session, e.g. in the dependency that builds the repository::
+
+        users = RepositoryLoader(BaseRepository(session, User))
+        authors = await asyncio.gather(*(users.load(post.author_id) for post in posts))
+    """
+
+    def __init__(self, repository: BaseRepository[ModelType]):
+        self.repository = repository
+        self._futures: Dict[ID, asyncio.Future] = {}
+        self._pending: Dict[ID, asyncio.Future] = {}
+        self._batches: Set[asyncio.Task] = set()
+        self._lock = asyncio.Lock()  # an AsyncSession can't run two queries at once
+
+    async def load(self, id_: ID) -> ModelType:
+        """Same result as ``repository.get_by_id``, including NotFoundRecord for a missing id."""
+        future = self._futures.get(id_)
+        if future is None:
+            future = self._schedule(id_)
+        return await asyncio.shield(future)
+
+    async def load_many(self, ids: Sequence[ID]) -> List[ModelType]:
+        return list(await asyncio.gather(*(self.load(id_) for id_ in ids)))
+
+    def prime(self, record: ModelType) -> None:
+        """Seed the cache with a record the caller already has."""
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(record)
+        self._futures[record.id] = future
+
+    def clear(self, id_: ID | None = None) -> None:
+        if id_ is None:
+            self._futures.clear()
+        else:
+            self._futures.pop(id_, None)
+
+    def _schedule(self, id_: ID) -> asyncio.Future:
+        if id_ in self._pending:  # cleared and requested again within the same tick
+            self._futures[id_] = self._pending[id_]
+            return self._pending[id_]
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._futures[id_] = self._pending[id_] = future
+        if len(self._pending) == 1:  # first key of this tick, dispatch once the tick is over
+            loop.call_soon(self._dispatch)
+        return future
+
+    def _dispatch(self) -> None:
+        futures, self._pending = self._pending, {}
+        batch = asyncio.ensure_future(self._load_batch(futures))
+        self._batches.add(batch)  # the loop only keeps weak references to tasks
+        batch.add_done_callback(self._batches.discard)
+
+    async def _load_batch(self, futures: Dict[ID, asyncio.Future]) -> None:
+        try:
+            async with self._lock:
+                records = await self.repository.get_by_ids(list(futures))
+        except Exception as exc:
+            for id_, future in futures.items():
+                if self._futures.get(id_) is future:  # failed loads are retried on the next call
+                    del self._futures[id_]
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        by_id = {record.id: record for record in records}
+        for id_, future in futures.items():
+            if future.done():
+                continue
+            if id_ in by_id:
+                future.set_result(by_id[id_])
+            else:
+                future.set_exception(NotFoundRecord(self.repository.model.__name__))
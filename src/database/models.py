@@ -1,8 +1,9 @@
 from src.database.base import Base
-from src.database.database import DatabaseHelper, database_helper
+from src.database.database import DatabaseHelper, get_database_helper, get_session
 
 __all__ = [
     "Base",
     "DatabaseHelper",
-    "database_helper"
+    "get_database_helper",
+    "get_session",
 ]
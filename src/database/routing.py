@@ -0,0 +1,70 @@
+import itertools
+from typing import Sequence, Literal
+
+from sqlalchemy import Engine, Select, event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.dml import UpdateBase
+from sqlalchemy.sql.lambdas import StatementLambdaElement
+
+
+ReplicaStrategy = Literal["round_robin", "least_connections"]
+
+
+class ReplicaRouter:
+    def __init__(
+            self,
+            primary: AsyncEngine,
+            replicas: Sequence[AsyncEngine],
+            strategy: ReplicaStrategy = "round_robin",
+    ):
+        self.primary = primary
+        self.replicas = list(replicas)
+        self.strategy = strategy
+        self._round_robin = itertools.cycle(self.replicas)
+
+    def pick_replica(self) -> Engine:
+        if not self.replicas:
+            return self.primary.sync_engine
+        if self.strategy == "least_connections":
+            return min(self.replicas, key=self._checked_out).sync_engine
+        return next(self._round_robin).sync_engine
+
+    @staticmethod
+    def _checked_out(engine: AsyncEngine) -> int:
+        checkedout = getattr(engine.pool, "checkedout", None)
+        return checkedout() if checkedout is not None else 0
+
+
+class RoutingSession(Session):
+    """Sends plain SELECTs to a replica and everything else to the primary.
+
+    After the first write (flush or DML statement) the session is pinned to the
+    primary until the transaction ends, so it always reads its own writes.
+    """
+
+    PINNED = "pinned_to_primary"
+
+    def __init__(self, *args, router: ReplicaRouter, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.router = router
+
+    def get_bind(self, mapper=None, clause=None, **kwargs) -> Engine:
+        if self._flushing or isinstance(clause, UpdateBase):
+            self.info[self.PINNED] = True
+
+        if self.info.get(self.PINNED) or not self._is_replica_safe(clause):
+            return self.router.primary.sync_engine
+        return self.router.pick_replica()
+
+    @staticmethod
+    def _is_replica_safe(clause) -> bool:
+        if isinstance(clause, StatementLambdaElement):  # lambda_stmt, e.g. CACHED_STATEMENTS get_by_id
+            clause = clause._resolved
+        return isinstance(clause, Select) and clause._for_update_arg is None
+
+
+@event.listens_for(RoutingSession, "after_commit")
+@event.listens_for(RoutingSession, "after_rollback")
+def _unpin_session(session: RoutingSession) -> None:
+    session.info.pop(RoutingSession.PINNED, None)
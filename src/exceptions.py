@@ -11,3 +11,8 @@ class NotFoundRecord(AppException):
         message = f"Not found record in model {model}"
         status_code = 404
         super().__init__(message, status_code)
+
+class InvalidCursorException(AppException):
+    def __init__(self):
+        message = "Invalid pagination cursor"
+        super().__init__(message, 400)
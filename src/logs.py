@@ -1,9 +1,99 @@
+import atexit
+import json
 import logging
+import os
+import queue
+import random
 import sys
+import weakref
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler, TimedRotatingFileHandler
 from pathlib import Path
+from typing import Dict, List
 
-LOGS_DIR = Path("logs")
-LOGS_DIR.mkdir(exist_ok=True)
+from src.config import LoggingSettings, get_settings
+
+DATEFMT = "%Y-%m-%d %H:%M:%S"
+
+_logging_settings: LoggingSettings | None = None
+_log_queue: queue.Queue = queue.Queue(-1)
+_listener: QueueListener | None = None
+_queue_handlers: "weakref.WeakSet[QueueHandler]" = weakref.WeakSet()
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "time": self.formatTime(record, self.datefmt),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            payload["exc_info"] = record.exc_text
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class DebugSampler(logging.Filter):
+    """Keeps every record above DEBUG and only a ``rate`` share of DEBUG ones."""
+
+    def __init__(self, rate: float):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.levelno > logging.DEBUG or random.random() < self.rate
+
+
+class _LazyDirectoryMixin:
+    """Defers creating the log directory and file until the first record is written."""
+
+    def _open(self):
+        Path(self.baseFilename).parent.mkdir(parents=True, exist_ok=True)
+        return super()._open()
+
+
+class LazyRotatingFileHandler(_LazyDirectoryMixin, RotatingFileHandler):
+    pass
+
+
+class LazyTimedRotatingFileHandler(_LazyDirectoryMixin, TimedRotatingFileHandler):
+    pass
+
+
+class _DispatchHandler(logging.Handler):
+    """Runs on the listener thread and hands each record to its own logger's handlers."""
+
+    def __init__(self):
+        super().__init__()
+        self.handlers_by_logger: Dict[str, List[logging.Handler]] = {}
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        for handler in self.handlers_by_logger.get(record.name, ()):
+            if record.levelno >= handler.level:
+                handler.handle(record)
+        return True
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.handle(record)
+
+
+_dispatcher = _DispatchHandler()
+
+
+def configure_logging(logging_settings: LoggingSettings | None) -> None:
+    """Override the settings used by loggers created after this call, ``None`` restores the defaults."""
+    global _logging_settings
+    _logging_settings = logging_settings
+
+
+def stop_logging() -> None:
+    """Flush queued records and stop the background listener."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
 
 
 def setup_logger(name: str) -> logging.Logger:
@@ -13,20 +103,88 @@ def setup_logger(name: str) -> logging.Logger:
     if logger.hasHandlers():
         return logger
 
-    formatter = logging.Formatter(
-        fmt="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S"
-    )
+    logging_settings = _get_logging_settings()
+    handlers = _build_handlers(name, logging_settings)
+
+    if logging_settings.log_debug_sample_rate < 1.0:
+        logger.addFilter(DebugSampler(logging_settings.log_debug_sample_rate))
+
+    if not logging_settings.log_queue:
+        for handler in handlers:
+            logger.addHandler(handler)
+        return logger
+
+    _dispatcher.handlers_by_logger[name] = handlers
+    queue_handler = QueueHandler(_log_queue)
+    _queue_handlers.add(queue_handler)
+    logger.addHandler(queue_handler)
+    _start_listener()
+
+    return logger
+
+
+def _build_handlers(name: str, logging_settings: LoggingSettings) -> List[logging.Handler]:
+    if logging_settings.log_format == "json":
+        formatter = JsonFormatter(datefmt=DATEFMT)
+    else:
+        formatter = logging.Formatter(
+            fmt="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+            datefmt=DATEFMT
+        )
 
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(formatter)
     console_handler.setLevel(logging.INFO)
+    handlers: List[logging.Handler] = [console_handler]
 
-    file_handler = logging.FileHandler(LOGS_DIR / f"{name}.log", encoding="utf-8")
-    file_handler.setFormatter(formatter)
-    file_handler.setLevel(logging.DEBUG)
+    if logging_settings.log_to_file:
+        file_handler = _build_file_handler(name, logging_settings)
+        file_handler.setFormatter(formatter)
+        file_handler.setLevel(logging.DEBUG)
+        handlers.append(file_handler)
 
-    logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
+    return handlers
 
-    return logger
+
+def _build_file_handler(name: str, logging_settings: LoggingSettings) -> logging.Handler:
+    path = Path(logging_settings.log_dir) / f"{name}.log"
+
+    if logging_settings.log_rotation == "time":
+        return LazyTimedRotatingFileHandler(
+            path, when=logging_settings.log_rotation_when,
+            backupCount=logging_settings.log_backup_count, encoding="utf-8", delay=True,
+        )
+    return LazyRotatingFileHandler(
+        path, maxBytes=logging_settings.log_max_bytes,
+        backupCount=logging_settings.log_backup_count, encoding="utf-8", delay=True,
+    )
+
+
+def _get_logging_settings() -> LoggingSettings:
+    return _logging_settings or get_settings().logging_settings
+
+
+def _start_listener() -> None:
+    global _listener
+    if _listener is None:
+        _listener = QueueListener(_log_queue, _dispatcher)
+        _listener.start()
+
+
+def _restart_listener_in_child() -> None:
+    """A forked child (Celery prefork, preload-then-fork servers) inherits the queue but
+    not the listener thread, records would pile up unwritten without a new one.
+    """
+    global _log_queue, _listener
+    was_running = _listener is not None
+    _log_queue = queue.Queue(-1)  # the inherited one may hold parent records and a held lock
+    for queue_handler in _queue_handlers:
+        queue_handler.queue = _log_queue
+    _listener = None
+    if was_running:
+        _start_listener()
+
+
+atexit.register(stop_logging)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_restart_listener_in_child)
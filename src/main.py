@@ -1,14 +1,52 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
+from starlette.concurrency import run_in_threadpool
 
+from src.api.jobs.router import router as jobs_router
+from src.api.metrics.router import router as metrics_router
+from src.database.database import dispose_database_helper, get_database_helper
+from src.database.instrumentation import QueryCountMiddleware, request_query_metrics
 from src.exceptions import AppException
+from src.metrics import metrics_registry
+from src.responses import FastJSONResponse
+from src.tasks.task_batcher import flush_all
+from src.timing import TimingMiddleware, request_metrics
+
 
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    database_helper = get_database_helper()
+    metrics_registry.register(database_helper.collect_metrics)
+    try:
+        yield
+    finally:
+        await run_in_threadpool(flush_all)  # publishing to the broker blocks
+        metrics_registry.unregister(database_helper.collect_metrics)
+        await dispose_database_helper()
 
-app = FastAPI()
 
-@app.exception_handler(AppException)
 async def app_exception_handler(request: Request, exc: AppException):
     return JSONResponse(
         status_code=exc.status_code,
         content={"detail": exc.message},
     )
+
+
+def create_app() -> FastAPI:
+    """Build the application; settings and engines are only touched once it starts."""
+    app = FastAPI(default_response_class=FastJSONResponse, lifespan=lifespan)
+    app.add_middleware(QueryCountMiddleware, metrics=request_query_metrics)
+    app.add_middleware(TimingMiddleware, metrics=request_metrics)
+    app.include_router(metrics_router)
+    app.include_router(jobs_router)
+    app.add_exception_handler(AppException, app_exception_handler)
+
+    metrics_registry.register(request_metrics.collect)
+    metrics_registry.register(request_query_metrics.collect)
+    return app
+
+
+app = create_app()
@@ -0,0 +1,85 @@
+import bisect
+from typing import Dict, Sequence, Any, List, Callable, Iterable
+
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus sense, no external client needed."""
+
+    DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.bucket_counts = [0] * (len(self.buckets) + 1)  # last slot is +Inf
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.bucket_counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative(self) -> Dict[str, int]:
+        result: Dict[str, int] = {}
+        total = 0
+        for bound, bucket_count in zip((*self.buckets, "+Inf"), self.bucket_counts):
+            total += bucket_count
+            result[str(bound)] = total
+        return result
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "avg": self.sum / self.count if self.count else 0.0,
+            "buckets": self.cumulative(),
+        }
+
+
+def format_labels(labels: Dict[str, Any]) -> str:
+    if not labels:
+        return ""
+    pairs = (f'{name}="{_escape_label_value(value)}"' for name, value in labels.items())
+    return "{" + ",".join(pairs) + "}"
+
+
+def _escape_label_value(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def format_histogram(name: str, histogram: Histogram, labels: Dict[str, Any] | None = None) -> List[str]:
+    labels = labels or {}
+    lines = [
+        f"{name}_bucket{format_labels({**labels, 'le': bound})} {count}"
+        for bound, count in histogram.cumulative().items()
+    ]
+    lines.append(f"{name}_sum{format_labels(labels)} {histogram.sum}")
+    lines.append(f"{name}_count{format_labels(labels)} {histogram.count}")
+    return lines
+
+
+def format_sample(name: str, value: float, labels: Dict[str, Any] | None = None) -> str:
+    return f"{name}{format_labels(labels or {})} {value}"
+
+
+class MetricsRegistry:
+    """Collects Prometheus text exposition lines from registered callables."""
+
+    def __init__(self):
+        self._collectors: List[Callable[[], Iterable[str]]] = []
+
+    def register(self, collector: Callable[[], Iterable[str]]) -> None:
+        if collector not in self._collectors:
+            self._collectors.append(collector)
+
+    def unregister(self, collector: Callable[[], Iterable[str]]) -> None:
+        if collector in self._collectors:
+            self._collectors.remove(collector)
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for collector in self._collectors:
+            lines.extend(collector())
+        return "\n".join(lines) + "\n"
+
+
+metrics_registry = MetricsRegistry()
@@ -1,8 +1,14 @@
-from typing import Generic, List
+import base64
+import hashlib
+import hmac
+import json
+from typing import Generic, List, Any, Sequence
 
 from pydantic import BaseModel, Field, ConfigDict
 
+from src.responses import FastJSONResponse
 from src.types import ModelType
+from src.exceptions import InvalidCursorException
 
 
 class PaginationParams(BaseModel):
@@ -14,3 +20,63 @@ class Pagination(BaseModel, Generic[ModelType]):
 
     count: int
     items: List[ModelType]
+
+    def as_response(self, status_code: int = 200) -> FastJSONResponse:
+        return FastJSONResponse({"count": self.count, "items": self.items}, status_code=status_code)
+
+class CursorPaginationParams(BaseModel):
+    limit: int = Field(10, ge=0, le=100)
+    cursor: str | None = None
+
+class CursorPagination(BaseModel, Generic[ModelType]):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    next_cursor: str | None
+    items: List[ModelType]
+
+    def as_response(self, status_code: int = 200) -> FastJSONResponse:
+        return FastJSONResponse({"next_cursor": self.next_cursor, "items": self.items}, status_code=status_code)
+
+
+class CursorCodec:
+    """Opaque, HMAC-signed cursor holding the keyset values of the last row.
+
+    ``scope`` (e.g. the ordering a cursor was issued for) is covered by the
+    signature, so a cursor only decodes under the scope it was encoded with.
+    """
+
+    DIGEST = hashlib.sha256
+
+    def __init__(self, secret: str):
+        self.secret = secret.encode("utf-8")
+
+    def encode(self, values: Sequence[Any], scope: str = "") -> str:
+        payload = json.dumps(list(values), default=str, separators=(",", ":")).encode("utf-8")
+        return f"{self._b64encode(payload)}.{self._b64encode(self._sign(payload, scope))}"
+
+    def decode(self, cursor: str, scope: str = "") -> list:
+        try:
+            raw_payload, raw_signature = cursor.split(".", 1)
+            payload = self._b64decode(raw_payload)
+            signature = self._b64decode(raw_signature)
+        except ValueError:
+            raise InvalidCursorException()
+
+        if not hmac.compare_digest(signature, self._sign(payload, scope)):
+            raise InvalidCursorException()
+
+        values = json.loads(payload)
+        if not isinstance(values, list):
+            raise InvalidCursorException()
+        return values
+
+    def _sign(self, payload: bytes, scope: str) -> bytes:
+        return hmac.new(self.secret, scope.encode("utf-8") + b"\0" + payload, self.DIGEST).digest()
+
+    @staticmethod
+    def _b64encode(raw: bytes) -> str:
+        return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+    @staticmethod
+    def _b64decode(raw: str) -> bytes:
+        return base64.urlsafe_b64decode(raw + "=" * (-len(raw) % 4))
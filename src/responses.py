@@ -0,0 +1,53 @@
+import json
+from collections.abc import Mapping
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any
+from uuid import UUID
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+from src.database.base import Base
+
+try:
+    import orjson
+except ImportError:  # optional, falls back to msgspec or the stdlib encoder
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, Base):
+        return obj.to_dict()
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    if isinstance(obj, Mapping):  # e.g. SQLAlchemy RowMapping
+        return dict(obj)
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if isinstance(obj, (UUID, Decimal)):
+        return str(obj)
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    raise TypeError(f"Object of type {obj.__class__.__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    """Serialize ORM records, pydantic models and plain data with the fastest encoder installed."""
+    if orjson is not None:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    if msgspec is not None:
+        return msgspec.json.encode(content, enc_hook=_default)
+    return json.dumps(content, default=_default, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse that skips FastAPI's generic jsonable_encoder when content is returned directly."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -0,0 +1,105 @@
+"""Launch uvicorn in the mode selected by ``SERVER_MODE``.
+
+development: one process with ``--reload``.
+production: ``SERVER_WORKERS`` processes (one per core by default) under uvicorn's
+supervisor. ``kill -HUP <pid>`` restarts the workers one by one, and each worker
+gets a share of ``DATABASE_POOL_BUDGET`` as the pool size of every engine (primary
+and replicas). Workers are capped when the budget can't give each one a connection.
+
+Usage: python -m src.server
+"""
+import os
+from typing import Any, Dict, Tuple
+
+import uvicorn
+
+from src.config import DataBaseSettings, ServerSettings, get_settings
+from src.logs import setup_logger
+
+APP = "src.main:app"
+
+logger = setup_logger(__name__)
+
+
+def resolve_workers(server_settings: ServerSettings) -> int:
+    if server_settings.server_mode == "development":
+        return 1
+    return server_settings.server_workers or os.cpu_count() or 1
+
+
+def engine_count(database_settings: DataBaseSettings) -> int:
+    return 1 + len(database_settings.database_replica_urls)
+
+
+def fit_workers_to_budget(database_settings: DataBaseSettings, workers: int) -> int:
+    """``workers``, capped so that the budget gives each one a connection per engine."""
+    budget = database_settings.database_pool_budget
+    if not budget:
+        return workers
+    if budget < engine_count(database_settings):
+        raise ValueError(
+            f"DATABASE_POOL_BUDGET={budget} is smaller than the {engine_count(database_settings)} "
+            f"database engines (primary and replicas)"
+        )
+    return min(workers, budget // engine_count(database_settings))
+
+
+def worker_pool_size(database_settings: DataBaseSettings, workers: int) -> Tuple[int, int] | None:
+    """(pool_size, max_overflow) per worker and engine, so that all workers' pools together
+    stay within the budget.
+    """
+    budget = database_settings.database_pool_budget
+    if not budget:
+        return None
+
+    pool_size = budget // (workers * engine_count(database_settings))
+    if pool_size < 1:
+        raise ValueError(
+            f"DATABASE_POOL_BUDGET={budget} can't give {workers} workers a connection "
+            f"to each of {engine_count(database_settings)} database engines"
+        )
+    return pool_size, 0
+
+
+def build_uvicorn_options(server_settings: ServerSettings) -> Dict[str, Any]:
+    options: Dict[str, Any] = {
+        "host": server_settings.server_host,
+        "port": server_settings.server_port,
+        "loop": server_settings.server_loop,  # "auto" picks uvloop when it is installed
+        "http": server_settings.server_http,  # likewise httptools
+        "timeout_keep_alive": server_settings.server_keep_alive,
+        "timeout_graceful_shutdown": server_settings.server_graceful_timeout,
+    }
+
+    if server_settings.server_mode == "development":
+        return {**options, "reload": True}
+
+    return {
+        **options,
+        "workers": resolve_workers(server_settings),
+        "limit_max_requests": server_settings.server_max_requests,
+        "proxy_headers": True,
+    }
+
+
+def main() -> None:
+    settings = get_settings()
+    options = build_uvicorn_options(settings.server_settings)
+
+    workers = options.get("workers", 1)
+    fitted_workers = fit_workers_to_budget(settings.database_settings, workers)
+    if fitted_workers < workers:
+        logger.warning(
+            f"running {fitted_workers} workers instead of {workers} to stay within DATABASE_POOL_BUDGET"
+        )
+        options["workers"] = workers = fitted_workers
+
+    pool = worker_pool_size(settings.database_settings, workers)
+    if pool is not None:  # inherited by the worker processes
+        os.environ["DATABASE_POOL_SIZE"], os.environ["DATABASE_MAX_OVERFLOW"] = map(str, pool)
+
+    uvicorn.run(APP, **options)
+
+
+if __name__ == "__main__":
+    main()
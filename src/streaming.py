@@ -0,0 +1,73 @@
+import csv
+import io
+from typing import Any, AsyncIterator, Callable, Sequence
+
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.database.base import Base
+from src.responses import dumps
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+CSV_MEDIA_TYPE = "text/csv"
+
+
+async def ndjson_lines(records: AsyncIterator[Any]) -> AsyncIterator[bytes]:
+    async for record in records:
+        yield dumps(record) + b"\n"
+
+
+async def csv_lines(records: AsyncIterator[Any], fieldnames: Sequence[str]) -> AsyncIterator[bytes]:
+    """Header line first, then one line per record; ORM records are written through ``to_dict``."""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fieldnames, extrasaction="ignore")
+
+    writer.writeheader()
+    yield _drain(buffer)
+
+    async for record in records:
+        writer.writerow(record.to_dict() if isinstance(record, Base) else record)
+        yield _drain(buffer)
+
+
+def ndjson_response(records: AsyncIterator[Any], status_code: int = 200) -> StreamingResponse:
+    return StreamingResponse(ndjson_lines(records), status_code=status_code, media_type=NDJSON_MEDIA_TYPE)
+
+
+def csv_response(
+        records: AsyncIterator[Any],
+        fieldnames: Sequence[str],
+        filename: str | None = None,
+        status_code: int = 200,
+) -> StreamingResponse:
+    headers = {"Content-Disposition": f'attachment; filename="{filename}"'} if filename else None
+    return StreamingResponse(
+        csv_lines(records, fieldnames), status_code=status_code, media_type=CSV_MEDIA_TYPE, headers=headers
+    )
+
+
+async def stream_in_session(
+        session_maker: async_sessionmaker[AsyncSession],
+        open_stream: Callable[[AsyncSession], AsyncIterator[Any]],
+) -> AsyncIterator[Any]:
+    """Run ``open_stream`` in a session owned by the response body.
+
+    A session from ``Depends(get_session)`` is closed before a StreamingResponse
+    starts sending, so streamed exports open their own, e.g.::
+
+        records = stream_in_session(
+            get_database_helper().session_maker,
+            lambda session: BaseRepository(session, User).stream_rows(batch_size=500),
+        )
+        return ndjson_response(records)
+    """
+    async with session_maker() as session:
+        async for record in open_stream(session):
+            yield record
+
+
+def _drain(buffer: io.StringIO) -> bytes:
+    data = buffer.getvalue()
+    buffer.seek(0)
+    buffer.truncate()
+    return data.encode("utf-8")
@@ -0,0 +1,88 @@
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, TypeVar
+
+from celery import Task
+from celery.signals import worker_process_shutdown
+
+from src.config import get_settings
+from src.database.database import DatabaseHelper, create_database_helper
+
+T = TypeVar("T")
+
+
+class DatabaseTask(Task):
+    """Celery task base sharing one event loop and DatabaseHelper per worker process.
+
+    The loop runs in a background thread, so pooled connections survive between
+    tasks and a task can be run eagerly even from code that already has a loop::
+
+        @celery_app.task(base=DatabaseTask, bind=True)
+        def import_people(self, rows):
+            async def run(session):
+                await BaseRepository(session, Person).bulk_create(rows)
+
+            self.run_in_session(run)
+    """
+
+    _lock = threading.Lock()
+    _loop: asyncio.AbstractEventLoop | None = None
+    _database_helper: DatabaseHelper | None = None
+
+    @property
+    def database_helper(self) -> DatabaseHelper:
+        cls = DatabaseTask
+        if cls._database_helper is None:
+            with cls._lock:
+                if cls._database_helper is None:
+                    cls._database_helper = create_database_helper(get_settings().database_settings)
+        return cls._database_helper
+
+    def run_async(self, coro: Awaitable[T]) -> T:
+        future: Future = asyncio.run_coroutine_threadsafe(coro, self._get_loop())
+        return future.result()
+
+    def run_in_session(self, func: Callable[..., Awaitable[T]], *args: Any, commit: bool = True) -> T:
+        """Await ``func(session, *args)`` in a pooled session, committing when it succeeds."""
+
+        async def run() -> T:
+            async with self.database_helper.session_maker() as session:
+                result = await func(session, *args)
+                if commit:
+                    await session.commit()
+                return result
+
+        return self.run_async(run())
+
+    @classmethod
+    def use_database_helper(cls, database_helper: DatabaseHelper | None) -> None:
+        """Swap the worker-level helper, e.g. for tests or a dedicated task database."""
+        DatabaseTask._database_helper = database_helper
+
+    @classmethod
+    def shutdown(cls) -> None:
+        loop, helper = DatabaseTask._loop, DatabaseTask._database_helper
+        if loop is None:
+            return
+        if helper is not None:
+            asyncio.run_coroutine_threadsafe(helper.dispose(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        DatabaseTask._loop = None
+        DatabaseTask._database_helper = None
+
+    @staticmethod
+    def _get_loop() -> asyncio.AbstractEventLoop:
+        cls = DatabaseTask
+        if cls._loop is None:
+            with cls._lock:
+                if cls._loop is None:
+                    loop = asyncio.new_event_loop()
+                    threading.Thread(target=loop.run_forever, name="database-task-loop", daemon=True).start()
+                    cls._loop = loop
+        return cls._loop
+
+
+@worker_process_shutdown.connect
+def _dispose_worker_database(**kwargs) -> None:
+    DatabaseTask.shutdown()
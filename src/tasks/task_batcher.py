@@ -0,0 +1,98 @@
+import atexit
+import threading
+import weakref
+from typing import Any, Callable, Generic, List, TypeVar
+
+from celery import Task
+from celery.result import AsyncResult
+from celery.signals import worker_process_shutdown
+
+T = TypeVar("T")
+
+_batchers: "weakref.WeakSet[TaskBatcher]" = weakref.WeakSet()
+
+
+class TaskBatcher(Generic[T]):
+    """Producer-side batching: ``add`` many small items, one task message per batch.
+
+    A batch is sent once it holds ``max_size`` items or ``max_delay`` seconds after
+    its first item, the task receives the items as a list and can hand them to a
+    single bulk repository call. Each message is still acked as a whole, so late
+    acks keep their delivery guarantee.
+
+    Batching is best-effort: until a batch is sent its items live only in this
+    process, and ``add`` returns ``None`` for them. ``flush_all`` runs at
+    interpreter exit, on Celery worker process shutdown and in the app lifespan,
+    anything else that stops the process (SIGKILL, a crash) loses the pending
+    batch. Call ``flush()`` yourself when the items must not wait.
+    """
+
+    def __init__(self, task: Task, max_size: int = 100, max_delay: float = 1.0):
+        self.task = task
+        self.max_size = max_size
+        self.max_delay = max_delay
+        self._items: List[T] = []
+        self._lock = threading.Lock()
+        self._timer: threading.Timer | None = None
+        _batchers.add(self)
+
+    def add(self, item: T) -> AsyncResult | None:
+        with self._lock:
+            self._items.append(item)
+            if len(self._items) < self.max_size:
+                self._start_timer()
+                return None
+            items = self._take()
+        return self.task.delay(items)
+
+    def flush(self) -> AsyncResult | None:
+        with self._lock:
+            items = self._take()
+        return self.task.delay(items) if items else None
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self.task(*args, **kwargs)
+
+    def _take(self) -> List[T]:
+        items, self._items = self._items, []
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        return items
+
+    def _start_timer(self) -> None:
+        if self._timer is None:
+            self._timer = threading.Timer(self.max_delay, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+
+def flush_all() -> None:
+    """Send the pending batch of every live batcher, called on shutdown."""
+    for batcher in list(_batchers):
+        batcher.flush()
+
+
+atexit.register(flush_all)
+
+
+@worker_process_shutdown.connect
+def _flush_worker_batches(**kwargs) -> None:
+    flush_all()
+
+
+def batched(max_size: int = 100, max_delay: float = 1.0) -> Callable[[Task], TaskBatcher]:
+    """Decorate a task that takes a list of items::
+
+        @batched(max_size=500, max_delay=0.5)
+        @celery_app.task(base=DatabaseTask, bind=True)
+        def create_events(self, events):
+            self.run_in_session(lambda session: BaseRepository(session, Event).bulk_create(events))
+
+        create_events.add({"name": "signup"})
+    """
+
+    def decorator(task: Task) -> TaskBatcher:
+        return TaskBatcher(task, max_size=max_size, max_delay=max_delay)
+
+    return decorator
@@ -0,0 +1,121 @@
+import inspect
+import time
+from contextvars import ContextVar
+from functools import wraps
+from typing import Dict, List, Tuple
+
+from starlette.types import ASGIApp, Scope, Receive, Send, Message
+
+from src.metrics import Histogram, format_histogram, format_sample
+
+
+_request_timings: ContextVar[Dict[str, float] | None] = ContextVar("request_timings", default=None)
+
+
+def record_timing(component: str, seconds: float) -> None:
+    """Add time spent in ``component`` to the Server-Timing breakdown of the current request."""
+    timings = _request_timings.get()
+    if timings is not None:
+        timings[component] = timings.get(component, 0.0) + seconds
+
+
+def timed(component: str):
+    """Decorator accounting a sync or async function's run time to ``component``."""
+
+    def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                started = time.perf_counter()
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    record_timing(component, time.perf_counter() - started)
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record_timing(component, time.perf_counter() - started)
+        return wrapper
+
+    return decorator
+
+
+def route_template(scope: Scope) -> str:
+    """Path template of the matched route, so metrics don't grow with path parameters."""
+    route = scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
+
+
+class RequestMetrics:
+    def __init__(self):
+        self.latency: Dict[Tuple[str, str], Histogram] = {}
+        self.responses: Dict[Tuple[str, str, int], int] = {}
+
+    def observe(self, method: str, route: str, status: int, seconds: float) -> None:
+        self.latency.setdefault((method, route), Histogram()).observe(seconds)
+        self.responses[(method, route, status)] = self.responses.get((method, route, status), 0) + 1
+
+    def collect(self) -> List[str]:
+        lines = ["# TYPE http_request_duration_seconds histogram"]
+        for (method, route), histogram in self.latency.items():
+            lines.extend(format_histogram(
+                "http_request_duration_seconds", histogram, {"method": method, "route": route}
+            ))
+
+        lines.append("# TYPE http_responses_total counter")
+        for (method, route, status), count in self.responses.items():
+            lines.append(format_sample(
+                "http_responses_total", count, {"method": method, "route": route, "status": status}
+            ))
+        return lines
+
+
+request_metrics = RequestMetrics()
+
+
+class TimingMiddleware:
+    """Per-route latency/status metrics and a ``Server-Timing`` header for every HTTP response."""
+
+    def __init__(self, app: ASGIApp, metrics: RequestMetrics = request_metrics):
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings: Dict[str, float] = {}
+        token = _request_timings.set(timings)
+        started = time.perf_counter()
+        status = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                total = time.perf_counter() - started
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", self._server_timing(timings, total).encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _request_timings.reset(token)
+            self.metrics.observe(
+                scope["method"], route_template(scope), status, time.perf_counter() - started
+            )
+
+    @staticmethod
+    def _server_timing(timings: Dict[str, float], total: float) -> str:
+        entries = [f"{component};dur={seconds * 1000:.2f}" for component, seconds in timings.items()]
+        entries.append(f"total;dur={total * 1000:.2f}")
+        return ", ".join(entries)
+
@@ -1,13 +1,15 @@
 import random
 
 import pytest
-from sqlalchemy import CheckConstraint
+from sqlalchemy import CheckConstraint, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import mapped_column, Mapped
 
 from src.database.base import Base
 from src.database.base_repository import BaseRepository
-from src.exceptions import NotFoundRecord
+from src.exceptions import NotFoundRecord, InvalidCursorException
+from src.pagination import CursorCodec, CursorPaginationParams, PaginationParams
 
 
 class PersonTestModel(Base):
@@ -18,10 +20,17 @@ class PersonTestModel(Base):
         CheckConstraint('age >= 0 AND age <= 120', name="check_age_range"),
     )
 
+class NullableTestModel(Base):
+    note: Mapped[str | None] = mapped_column()
+
 @pytest.fixture
 def repo(session: AsyncSession) -> BaseRepository[PersonTestModel]:
     return BaseRepository(session, PersonTestModel)
 
+@pytest.fixture
+def cursor_codec() -> CursorCodec:
+    return CursorCodec("cursor-secret")
+
 async def add_new_person(repo: BaseRepository, session: AsyncSession) -> PersonTestModel:
     obj_in = {"name": "test", "age": 10}
 
@@ -133,4 +142,283 @@ async def test_get_one_by_condition(repo: BaseRepository, session: AsyncSession)
 async def test_get_one_by_condition_not_found(repo: BaseRepository):
     result = await repo.get_one_by_conditions(repo.model.name == "")
 
-    assert result is None
\ No newline at end of file
+    assert result is None
+
+@pytest.mark.asyncio
+async def test_paginate_by_cursor(repo: BaseRepository, session: AsyncSession, cursor_codec: CursorCodec):
+    for age in range(5):
+        await repo.create({"name": "cursor", "age": age})
+    await session.commit()
+
+    condition = repo.model.name == "cursor"
+    first_page = await repo.paginate_by_cursor(CursorPaginationParams(limit=2), cursor_codec, condition)
+    second_page = await repo.paginate_by_cursor(
+        CursorPaginationParams(limit=2, cursor=first_page.next_cursor), cursor_codec, condition
+    )
+    last_page = await repo.paginate_by_cursor(
+        CursorPaginationParams(limit=2, cursor=second_page.next_cursor), cursor_codec, condition
+    )
+
+    assert [obj.age for obj in first_page.items] == [0, 1]
+    assert [obj.age for obj in second_page.items] == [2, 3]
+    assert [obj.age for obj in last_page.items] == [4]
+    assert last_page.next_cursor is None
+
+@pytest.mark.asyncio
+async def test_paginate_by_cursor_order_by_descending(repo: BaseRepository, cursor_codec: CursorCodec):
+    condition = repo.model.name == "cursor"
+    params = CursorPaginationParams(limit=3)
+
+    first_page = await repo.paginate_by_cursor(
+        params, cursor_codec, condition, order_by=(repo.model.age,), descending=True
+    )
+    second_page = await repo.paginate_by_cursor(
+        CursorPaginationParams(limit=3, cursor=first_page.next_cursor), cursor_codec, condition,
+        order_by=(repo.model.age,), descending=True,
+    )
+
+    assert [obj.age for obj in first_page.items] == [4, 3, 2]
+    assert [obj.age for obj in second_page.items] == [1, 0]
+
+@pytest.mark.asyncio
+async def test_paginate_by_cursor_tampered_cursor(repo: BaseRepository, cursor_codec: CursorCodec):
+    cursor = CursorCodec("other-secret").encode([1])
+
+    with pytest.raises(InvalidCursorException):
+        await repo.paginate_by_cursor(CursorPaginationParams(cursor=cursor), cursor_codec)
+
+@pytest.mark.asyncio
+async def test_paginate_by_cursor_rejects_cursor_from_other_ordering(
+        repo: BaseRepository, cursor_codec: CursorCodec
+):
+    condition = repo.model.name == "cursor"
+    page = await repo.paginate_by_cursor(CursorPaginationParams(limit=1), cursor_codec, condition)
+
+    with pytest.raises(InvalidCursorException):
+        await repo.paginate_by_cursor(
+            CursorPaginationParams(limit=1, cursor=page.next_cursor), cursor_codec, condition,
+            order_by=(repo.model.age,), descending=True,
+        )
+
+@pytest.mark.asyncio
+async def test_paginate_by_cursor_rejects_nullable_order_by(session: AsyncSession, cursor_codec: CursorCodec):
+    repo = BaseRepository(session, NullableTestModel)
+
+    with pytest.raises(ValueError):
+        await repo.paginate_by_cursor(CursorPaginationParams(limit=1), cursor_codec, order_by=(repo.model.note,))
+
+@pytest.mark.asyncio
+async def test_bulk_create(repo: BaseRepository, session: AsyncSession):
+    objs_in = [{"name": "bulk", "age": age} for age in range(10)]
+
+    created = await repo.bulk_create(objs_in, chunk_size=3, returning=True)
+    await repo.bulk_create(objs_in, chunk_size=4)
+    await session.commit()
+
+    assert [obj.age for obj in created] == list(range(10))
+    assert all(obj.id is not None for obj in created)
+    assert await repo.count(repo.model.name == "bulk") == 20
+
+@pytest.mark.asyncio
+async def test_bulk_update(repo: BaseRepository, session: AsyncSession):
+    records = await repo.get_by_conditions(repo.model.name == "bulk", limit=5)
+
+    await repo.bulk_update([{"id": obj.id, "age": 100} for obj in records], chunk_size=2)
+    await session.commit()
+
+    assert await repo.count(repo.model.name == "bulk", repo.model.age == 100) == 5
+
+@pytest.mark.asyncio
+async def test_bulk_delete(repo: BaseRepository, session: AsyncSession):
+    records = await repo.get_by_conditions(repo.model.name == "bulk", limit=100)
+
+    deleted = await repo.bulk_delete([obj.id for obj in records], chunk_size=7)
+    await session.commit()
+
+    assert deleted == 20
+    assert await repo.count(repo.model.name == "bulk") == 0
+
+@pytest.mark.asyncio
+async def test_upsert(repo: BaseRepository, session: AsyncSession):
+    obj = await repo.create({"name": "upsert", "age": 1})
+    await session.commit()
+
+    records = await repo.upsert(
+        [{"id": obj.id, "name": "upsert", "age": 2}, {"id": obj.id + 1000, "name": "upsert", "age": 3}],
+        returning=True,
+    )
+    await session.commit()
+
+    assert [record.age for record in records] == [2, 3]
+    assert (await repo.get_by_id(obj.id)).age == 2
+
+@pytest.mark.asyncio
+async def test_update_by_id(repo: BaseRepository, session: AsyncSession):
+    obj = await repo.create({"name": "direct", "age": 10})
+    await session.commit()
+
+    updated = await repo.update_by_id(obj.id, {"age": 11})
+
+    assert updated.id == obj.id
+    assert updated.age == 11
+    assert updated.name == "direct"
+
+@pytest.mark.asyncio
+async def test_update_by_id_not_found(repo: BaseRepository):
+    with pytest.raises(NotFoundRecord):
+        await repo.update_by_id(random.randint(99999, 999999999), {"age": 11})
+
+@pytest.mark.asyncio
+async def test_delete_by_id(repo: BaseRepository, session: AsyncSession):
+    obj = await repo.create({"name": "direct", "age": 10})
+    await session.commit()
+
+    await repo.delete_by_id(obj.id)
+
+    with pytest.raises(NotFoundRecord):
+        await repo.delete_by_id(obj.id)
+
+@pytest.mark.asyncio
+async def test_paginate(repo: BaseRepository, session: AsyncSession):
+    await repo.bulk_create([{"name": "paginate", "age": age} for age in range(7)])
+    await session.commit()
+
+    condition = repo.model.name == "paginate"
+    page = await repo.paginate(PaginationParams(limit=5, offset=5), condition)
+
+    assert page.count == 7
+    assert len(page.items) == 2
+
+@pytest.mark.asyncio
+async def test_paginate_out_of_range(repo: BaseRepository):
+    condition = repo.model.name == "paginate"
+
+    page = await repo.paginate(PaginationParams(limit=5, offset=50), condition)
+    estimated_page = await repo.paginate(PaginationParams(limit=5), condition, estimated=True)
+
+    assert page.count == 7
+    assert page.items == []
+    assert estimated_page.count == 7
+
+def test_explain_stmt_keeps_colons_in_literal_values(repo: BaseRepository):
+    stmt = select(repo.model.id).where(repo.model.name == "see :note", repo.model.age == 1)
+
+    explain = repo._explain_stmt(stmt)
+
+    assert explain.compile().params == {}
+    assert "'see :note'" in str(explain)
+
+@pytest.mark.asyncio
+async def test_get_rows(repo: BaseRepository, session: AsyncSession):
+    await repo.bulk_create([{"name": "rows", "age": age} for age in range(3)])
+    await session.commit()
+
+    rows = await repo.get_rows(repo.model.name == "rows", limit=2)
+
+    assert len(rows) == 2
+    assert set(rows[0]) == {"id", "name", "age"}
+    assert rows[0]["name"] == "rows"
+
+@pytest.mark.asyncio
+async def test_stream(repo: BaseRepository, session: AsyncSession):
+    await repo.bulk_create([{"name": "stream", "age": age} for age in range(5)])
+    await session.commit()
+
+    records = [
+        record async for record in repo.stream(
+            repo.model.name == "stream", batch_size=2, order_by=[repo.model.age]
+        )
+    ]
+
+    assert [record.age for record in records] == [0, 1, 2, 3, 4]
+    assert all(isinstance(record, PersonTestModel) for record in records)
+
+@pytest.mark.asyncio
+async def test_stream_rows(repo: BaseRepository):
+    rows = [row async for row in repo.stream_rows(repo.model.name == "stream", batch_size=2)]
+
+    assert len(rows) == 5
+    assert set(rows[0]) == {"id", "name", "age"}
+
+class CachedStatementRepository(BaseRepository[PersonTestModel]):
+    CACHED_STATEMENTS = True
+
+@pytest.mark.asyncio
+async def test_cached_statements_bind_fresh_values(session: AsyncSession):
+    repo = CachedStatementRepository(session, PersonTestModel)
+    people = await repo.bulk_create([{"name": "cached_stmt", "age": age} for age in (1, 2)], returning=True)
+    await session.commit()
+
+    for person in people:  # same cached statement, different parameters
+        assert (await repo.get_by_id(person.id)).age == person.age
+        assert await repo.count(repo.model.name == "cached_stmt", repo.model.age == person.age) == 1
+        records = await repo.get_by_conditions(repo.model.age == person.age, repo.model.name == "cached_stmt")
+        assert [record.id for record in records] == [person.id]
+
+    assert await repo.exists(repo.model.name == "cached_stmt")
+    assert not await repo.exists(repo.model.name == "cached_stmt", repo.model.age == 3)
+    assert len(await repo.get_by_conditions(repo.model.name == "cached_stmt", limit=1)) == 1
+
+@pytest.mark.asyncio
+async def test_exists_without_conditions_uses_model_table(repo: BaseRepository):
+    assert await repo.exists()
+
+@pytest.mark.asyncio
+async def test_first(repo: BaseRepository, session: AsyncSession):
+    await repo.bulk_create([{"name": "first", "age": age} for age in (5, 7, 6)])
+    await session.commit()
+
+    oldest = await repo.first(repo.model.name == "first", order_by=[repo.model.age.desc()])
+
+    assert oldest.age == 7
+    assert await repo.first(repo.model.name == "first", repo.model.age == 99) is None
+
+@pytest.mark.asyncio
+async def test_create_if_absent(repo: BaseRepository, session: AsyncSession):
+    unknown_id = random.randint(99999, 999999999)
+
+    created = await repo.create_if_absent({"id": unknown_id, "name": "absent", "age": 1})
+    duplicate = await repo.create_if_absent({"id": unknown_id, "name": "absent", "age": 2})
+    await session.commit()
+
+    assert created.id == unknown_id
+    assert duplicate is None
+    assert (await repo.get_by_id(unknown_id)).age == 1
+
+@pytest.mark.asyncio
+async def test_get_or_create(repo: BaseRepository, session: AsyncSession):
+    unknown_id = random.randint(99999, 999999999)
+
+    record, created = await repo.get_or_create({"id": unknown_id, "name": "get_or_create", "age": 1})
+    same_record, created_again = await repo.get_or_create({"id": unknown_id, "name": "get_or_create", "age": 2})
+
+    assert created and not created_again
+    assert same_record.id == record.id
+    assert same_record.age == 1
+
+@pytest.mark.asyncio
+async def test_create_if_absent_savepoint_fallback(repo: BaseRepository, session: AsyncSession, monkeypatch):
+    monkeypatch.setattr(repo, "UPSERT_DIALECTS", {})
+    unknown_id = random.randint(99999, 999999999)
+
+    created = await repo.create_if_absent({"id": unknown_id, "name": "savepoint", "age": 1})
+    duplicate = await repo.create_if_absent({"id": unknown_id, "name": "savepoint", "age": 2})
+    await session.commit()
+
+    assert created.id == unknown_id
+    assert duplicate is None
+    assert await repo.count(repo.model.name == "savepoint") == 1
+
+@pytest.mark.asyncio
+async def test_create_if_absent_savepoint_fallback_raises_constraint_errors(
+        repo: BaseRepository, session: AsyncSession, monkeypatch
+):
+    monkeypatch.setattr(repo, "UPSERT_DIALECTS", {})
+    unknown_id = random.randint(99999, 999999999)
+
+    with pytest.raises(IntegrityError):
+        await repo.create_if_absent({"id": unknown_id, "name": None, "age": 1})
+    with pytest.raises(IntegrityError):
+        await repo.get_or_create({"id": unknown_id, "name": "savepoint_invalid", "age": 500})
+
+    assert not await repo.exists(repo.model.id == unknown_id)  # only the savepoint was rolled back
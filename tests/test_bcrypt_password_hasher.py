@@ -1,6 +1,12 @@
+import asyncio
 import random
 import string
 
+import pytest
+
+from src.api.auth.exceptions import PasswordHasherOverloadedException
+from src.api.auth.utils.password_hasher.bcrypt_password_hasher import BcryptPasswordHasher
+from src.api.auth.utils.password_hasher.hashing_executor import HashingExecutor
 from src.api.auth.utils.password_hasher.password_hasher import PasswordHasher
 
 
@@ -16,4 +22,40 @@ def test_password_hash_and_verify(password_hasher: PasswordHasher):
 
     assert hash_password != password
     assert password_hasher.verify_password(password, hash_password)
-    assert not password_hasher.verify_password(not_use_password, hash_password)
\ No newline at end of file
+    assert not password_hasher.verify_password(not_use_password, hash_password)
+
+@pytest.mark.asyncio
+async def test_async_password_hash_and_verify(password_hasher: PasswordHasher):
+    password = generate_random_string()
+
+    hash_password = await password_hasher.ahash_password(password)
+
+    assert await password_hasher.averify_password(password, hash_password)
+    assert not await password_hasher.averify_password(generate_random_string(), hash_password)
+    assert password_hasher.executor.stats()["completed"] == 3
+
+@pytest.mark.asyncio
+async def test_async_password_hash_rejects_over_queue_limit():
+    password_hasher = BcryptPasswordHasher(rounds=4, executor=HashingExecutor(max_workers=1, max_queue=1))
+
+    results = await asyncio.gather(
+        *(password_hasher.ahash_password(generate_random_string()) for _ in range(4)),
+        return_exceptions=True,
+    )
+
+    assert sum(isinstance(result, PasswordHasherOverloadedException) for result in results) == 2
+    assert password_hasher.executor.rejected == 2
+
+def test_needs_rehash_and_verify_and_update():
+    password = generate_random_string()
+    old_hash = BcryptPasswordHasher(rounds=4).hash_password(password)
+    password_hasher = BcryptPasswordHasher(rounds=5)
+
+    is_valid, new_hash = password_hasher.verify_and_update(password, old_hash)
+
+    assert password_hasher.needs_rehash(old_hash)
+    assert is_valid
+    assert BcryptPasswordHasher.get_rounds(new_hash) == 5
+    assert not password_hasher.needs_rehash(new_hash)
+    assert password_hasher.verify_and_update(password, new_hash) == (True, None)
+    assert password_hasher.verify_and_update(generate_random_string(), old_hash) == (False, None)
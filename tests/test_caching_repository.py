@@ -0,0 +1,167 @@
+import asyncio
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.cache.cache_backend import CacheBackend
+from src.cache.memory_cache_backend import MemoryCacheBackend
+from src.database.caching_repository import CachingRepository, RepositoryCache
+from src.exceptions import NotFoundRecord
+from tests.fixtures.session_settings import SessionLocal
+from tests.test_base_repository import PersonTestModel
+
+
+@pytest.fixture
+def cache() -> RepositoryCache:
+    return RepositoryCache(MemoryCacheBackend(max_size=100, ttl=60), ttl=60)
+
+@pytest.fixture
+def repo(session: AsyncSession, cache: RepositoryCache) -> CachingRepository[PersonTestModel]:
+    return CachingRepository(session, PersonTestModel, cache)
+
+async def add_cached_person(repo: CachingRepository, session: AsyncSession) -> PersonTestModel:
+    obj = await repo.create({"name": "cached", "age": 30})
+    await session.commit()
+    return obj
+
+@pytest.mark.asyncio
+async def test_get_by_id_served_from_cache(repo: CachingRepository, session: AsyncSession, cache: RepositoryCache):
+    obj = await add_cached_person(repo, session)
+
+    async with SessionLocal() as other_session:
+        other_repo = CachingRepository(other_session, PersonTestModel, cache)
+        await other_repo.get_by_id(obj.id)
+    async with SessionLocal() as other_session:
+        other_repo = CachingRepository(other_session, PersonTestModel, cache)
+        cached = await other_repo.get_by_id(obj.id)
+
+        assert cached.name == "cached"
+        assert cached in other_session
+        assert cache.stats()["hits"] == 1
+
+@pytest.mark.asyncio
+async def test_update_invalidates(repo: CachingRepository, session: AsyncSession, cache: RepositoryCache):
+    obj = await add_cached_person(repo, session)
+
+    async with SessionLocal() as other_session:
+        await CachingRepository(other_session, PersonTestModel, cache).get_by_id(obj.id)
+
+    await repo.update(obj.id, {"age": 31})
+    await session.commit()
+
+    async with SessionLocal() as other_session:
+        updated = await CachingRepository(other_session, PersonTestModel, cache).get_by_id(obj.id)
+
+    assert updated.age == 31
+
+@pytest.mark.asyncio
+async def test_count_invalidated_by_create(repo: CachingRepository, session: AsyncSession):
+    before = await repo.count(repo.model.name == "cached")
+    await add_cached_person(repo, session)
+
+    assert await repo.count(repo.model.name == "cached") == before + 1
+
+@pytest.mark.asyncio
+async def test_get_by_id_not_found(repo: CachingRepository):
+    with pytest.raises(NotFoundRecord):
+        await repo.get_by_id(999999999)
+
+@pytest.mark.asyncio
+async def test_single_flight(cache: RepositoryCache):
+    calls = 0
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"value": 1}
+
+    results = await asyncio.gather(*(cache.get_or_load("hot", loader) for _ in range(10)))
+
+    assert calls == 1
+    assert all(result == {"value": 1} for result in results)
+
+class BrokenCacheBackend(CacheBackend):
+    async def get(self, key):
+        raise ConnectionError("cache is down")
+
+    async def set(self, key, value, ttl=None):
+        raise ConnectionError("cache is down")
+
+    async def delete(self, *keys):
+        raise ConnectionError("cache is down")
+
+    async def clear(self):
+        raise ConnectionError("cache is down")
+
+@pytest.mark.asyncio
+async def test_backend_errors_are_cache_misses():
+    cache = RepositoryCache(BrokenCacheBackend())
+
+    async def loader():
+        await asyncio.sleep(0.01)
+        return {"value": 1}
+
+    results = await asyncio.wait_for(asyncio.gather(*(cache.get_or_load("hot", loader) for _ in range(5))), 1)
+
+    assert all(result == {"value": 1} for result in results)
+    assert cache.stats()["in_flight"] == 0
+    await cache.invalidate("table", 1, all_rows=True)  # logged, not raised
+
+@pytest.mark.asyncio
+async def test_commit_invalidates_entries_cached_before_commit(
+        repo: CachingRepository, session: AsyncSession, cache: RepositoryCache
+):
+    obj = await add_cached_person(repo, session)
+    await repo.update_by_id(obj.id, {"age": 40})
+
+    stale_key = await repo._id_key(obj.id)  # what a concurrent reader caches before the commit
+    await cache.backend.set(stale_key, {"id": obj.id, "name": "cached", "age": 30})
+    await session.commit()
+
+    async with SessionLocal() as other_session:
+        updated = await CachingRepository(other_session, PersonTestModel, cache).get_by_id(obj.id)
+
+    assert updated.age == 40
+
+@pytest.mark.asyncio
+async def test_savepoint_rollback_keeps_pending_invalidation(
+        repo: CachingRepository, session: AsyncSession, cache: RepositoryCache
+):
+    obj = await add_cached_person(repo, session)
+    await repo.update_by_id(obj.id, {"age": 41})
+    with pytest.raises(IntegrityError):
+        async with session.begin_nested():
+            await repo.create({"name": None, "age": 1})
+
+    assert repo._has_pending_writes()
+    await session.commit()
+    assert not repo._has_pending_writes()
+
+@pytest.mark.asyncio
+async def test_writing_session_bypasses_cache_until_commit(
+        repo: CachingRepository, session: AsyncSession, cache: RepositoryCache
+):
+    await repo.create({"name": "uncommitted", "age": 1})
+    misses = cache.stats()["misses"]
+
+    assert await repo.count(repo.model.name == "uncommitted") == 1
+    assert cache.stats()["misses"] == misses
+
+    await session.rollback()
+    assert await repo.count(repo.model.name == "uncommitted") == 0
+    assert cache.stats()["misses"] == misses + 1
+
+@pytest.mark.asyncio
+async def test_memory_backend_evicts_least_recently_used():
+    backend = MemoryCacheBackend(max_size=2, ttl=60)
+
+    await backend.set("a", 1)
+    await backend.set("b", 2)
+    await backend.get("a")
+    await backend.set("c", 3)
+
+    assert await backend.get("a") == 1
+    assert await backend.get("b") is None
+    assert len(backend) == 2
@@ -0,0 +1,34 @@
+import pytest
+from pydantic import ValidationError
+
+from src.config import Settings, get_settings
+from src.database.database import get_database_helper
+from src.main import create_app
+from src.metrics import metrics_registry
+
+
+def test_settings_groups_are_read_on_first_access(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)  # no .env.backend to fall back on
+    monkeypatch.delenv("CELERY_BROKER_URL", raising=False)
+    settings = Settings()  # nothing is parsed yet
+
+    assert settings.hashing_settings is settings.hashing_settings
+    with pytest.raises(ValidationError):
+        settings.celery_settings
+
+def test_get_settings_is_cached():
+    assert get_settings() is get_settings()
+
+@pytest.mark.asyncio
+async def test_lifespan_creates_and_disposes_database_helper():
+    get_database_helper.cache_clear()
+    app = create_app()
+
+    assert get_database_helper.cache_info().currsize == 0
+
+    async with app.router.lifespan_context(app):
+        database_helper = get_database_helper()
+        assert database_helper.collect_metrics in metrics_registry._collectors
+
+    assert database_helper.collect_metrics not in metrics_registry._collectors
+    assert get_database_helper.cache_info().currsize == 0
@@ -0,0 +1,94 @@
+from typing import Iterator
+
+import pytest
+from fastapi import FastAPI
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from benchmarks.asgi import asgi_request
+from src.database.base_repository import BaseRepository
+from src.database.instrumentation import (
+    QueryCountMiddleware, QueryInstrumentation, RequestQueryMetrics, track_queries
+)
+from tests.fixtures.session_settings import SessionLocal, engine
+from tests.test_base_repository import PersonTestModel
+
+
+@pytest.fixture
+def instrumentation() -> Iterator[QueryInstrumentation]:
+    instrumentation = QueryInstrumentation(slow_query_threshold=0.0)
+    instrumentation.attach(engine)
+    yield instrumentation
+    instrumentation.detach(engine)
+
+@pytest.fixture
+def repo(session: AsyncSession) -> BaseRepository[PersonTestModel]:
+    return BaseRepository(session, PersonTestModel)
+
+@pytest.mark.asyncio
+async def test_statements_are_counted_and_labelled(
+        repo: BaseRepository, session: AsyncSession, instrumentation: QueryInstrumentation
+):
+    obj = await repo.create({"name": "instrumented", "age": 1})
+    await session.commit()
+
+    with track_queries() as queries:
+        await repo.get_by_id(obj.id)
+        await repo.get_one_by_conditions(repo.model.name == "instrumented")
+
+    operations = instrumentation.snapshot()["operations"]
+
+    assert queries.count == 2
+    assert operations["PersonTestModel.get_by_id"]["latency"]["count"] == 1
+    assert operations["PersonTestModel.get_one_by_conditions"]["latency"]["count"] == 1
+    assert "PersonTestModel.get_by_conditions" not in operations
+    assert instrumentation.slow_queries >= 2
+
+@pytest.mark.asyncio
+async def test_track_queries_detects_n_plus_one(
+        repo: BaseRepository, session: AsyncSession, instrumentation: QueryInstrumentation
+):
+    objs = await repo.bulk_create([{"name": "n_plus_one", "age": age} for age in range(3)], returning=True)
+    await session.commit()
+
+    with track_queries() as queries:
+        for obj in objs:
+            await repo.get_by_id(obj.id)
+
+    assert queries.count == 3
+
+@pytest.mark.asyncio
+async def test_failed_statement_is_not_recorded(
+        repo: BaseRepository, session: AsyncSession, instrumentation: QueryInstrumentation
+):
+    with pytest.raises(IntegrityError):
+        await repo.create({"name": None, "age": 1})
+        await session.flush()
+    await session.rollback()
+
+    await repo.count(repo.model.name == "instrumented")
+
+    operations = instrumentation.snapshot()["operations"]
+    assert "PersonTestModel.create" not in operations
+    assert operations["PersonTestModel.count"]["latency"]["count"] == 1
+
+@pytest.mark.asyncio
+async def test_query_count_middleware_counts_statements_per_request(instrumentation: QueryInstrumentation):
+    metrics = RequestQueryMetrics()
+    app = FastAPI()
+    app.add_middleware(QueryCountMiddleware, metrics=metrics)
+
+    @app.get("/people/{name}")
+    async def count_people(name: str):
+        async with SessionLocal() as session:
+            repo = BaseRepository(session, PersonTestModel)
+            return {
+                "exists": await repo.exists(repo.model.name == name),
+                "count": await repo.count(repo.model.name == name),
+            }
+
+    status, headers, _ = await asgi_request(app, "GET", "/people/instrumented")
+
+    assert status == 200
+    assert headers["x-db-queries"] == "2"
+    assert metrics.queries[("GET", "/people/{name}")].sum == 2
@@ -0,0 +1,80 @@
+import json
+from typing import Iterator
+
+import pytest
+from fastapi import FastAPI
+
+from benchmarks.asgi import asgi_request
+from src.api.jobs.job_service import JobService
+from src.api.jobs.router import get_job_service
+from src.cache.memory_cache_backend import MemoryCacheBackend
+from src.celery_app import celery_app
+from src.main import create_app
+
+
+@celery_app.task(name="tests.add")
+def add(x: int, y: int) -> int:
+    return x + y
+
+@celery_app.task(name="tests.fail")
+def fail() -> None:
+    raise ValueError("boom")
+
+@pytest.fixture
+def job_service() -> JobService:
+    return JobService(celery_app, ["tests.add", "tests.fail"], MemoryCacheBackend(max_size=10, ttl=60))
+
+@pytest.fixture
+def app(job_service: JobService) -> Iterator[FastAPI]:
+    app = create_app()
+    app.dependency_overrides[get_job_service] = lambda: job_service
+    yield app
+    celery_app.conf.task_always_eager = False
+
+@pytest.mark.asyncio
+async def test_submit_poll_and_fetch_result(app: FastAPI, job_service: JobService):
+    celery_app.conf.task_always_eager = True
+
+    status, headers, body = await asgi_request(app, "POST", "/jobs/tests.add", {"args": [2, 3]})
+    job_id = json.loads(body)["job_id"]
+
+    assert status == 202
+    assert headers["location"].endswith(f"/jobs/{job_id}")
+
+    status, _, body = await asgi_request(app, "GET", f"/jobs/{job_id}")
+    assert status == 200
+    assert json.loads(body)["status"] == "SUCCESS"
+
+    status, _, body = await asgi_request(app, "GET", f"/jobs/{job_id}/result")
+    assert status == 200
+    assert json.loads(body) == {"job_id": job_id, "result": 5}
+    assert await job_service.result_cache.get(f"job:{job_id}") is not None
+
+@pytest.mark.asyncio
+async def test_failed_job_result(app: FastAPI):
+    celery_app.conf.task_always_eager = True
+
+    _, _, body = await asgi_request(app, "POST", "/jobs/tests.fail")
+    job_id = json.loads(body)["job_id"]
+    status, _, body = await asgi_request(app, "GET", f"/jobs/{job_id}/result")
+
+    assert status == 500
+    assert json.loads(body)["detail"] == f"Job {job_id} failed"
+
+    _, _, body = await asgi_request(app, "GET", f"/jobs/{job_id}")
+    assert json.loads(body)["error"] == "Job failed"
+    assert "boom" not in body.decode()
+
+@pytest.mark.asyncio
+async def test_pending_job_result_is_accepted(app: FastAPI):
+    _, _, body = await asgi_request(app, "POST", "/jobs/tests.add", {"args": [1, 1]})
+    status, _, body = await asgi_request(app, "GET", f"/jobs/{json.loads(body)['job_id']}/result")
+
+    assert status == 202
+    assert json.loads(body)["status"] == "PENDING"
+
+@pytest.mark.asyncio
+async def test_unknown_job_is_rejected(app: FastAPI):
+    status, _, _ = await asgi_request(app, "POST", "/jobs/os.system", {"args": ["ls"]})
+
+    assert status == 404
@@ -1,9 +1,15 @@
 import os
+import time
 
+import jwt
 import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
 
+from src.api.auth.utils.token.jwt_keyring import JWTKey, JWTKeyring
 from src.api.auth.utils.token.jwt_token_service import JWTTokenService
-from src.api.auth.exceptions import ExpiredTokenException, DecodeTokenException
+from src.api.auth.utils.token.verified_token_cache import VerifiedTokenCache
+from src.api.auth.exceptions import ExpiredTokenException, DecodeTokenException, InvalidTokenException
 
 
 @pytest.fixture
@@ -33,4 +39,95 @@ def test_encode_and_decode_jwt_service_with_exc_decode_token(jwt_service, jwt_se
     token = jwt_service.encode(data, expires)
 
     with pytest.raises(DecodeTokenException):
-        jwt_service_bad_secret.decode(token)
\ No newline at end of file
+        jwt_service_bad_secret.decode(token)
+
+def test_encode_without_expiry_is_rejected(jwt_service, data):
+    with pytest.raises(ValueError):
+        jwt_service.encode(data)
+
+def test_decode_served_from_verified_token_cache(data, expires):
+    service = JWTTokenService(os.getenv("SECRET_KEY"), os.getenv("TOKEN_ALGORITHM"), VerifiedTokenCache(max_size=2))
+    token = service.encode(data, expires)
+
+    first = service.decode(token)
+    second = service.decode(token)
+
+    assert first == second
+    assert service.cache.stats() == {"hits": 1, "misses": 1, "size": 1}
+
+def test_verified_token_cache_skips_expired_claims():
+    cache = VerifiedTokenCache()
+    cache.set("token", {"sub": "123", "exp": int(time.time()) - 1})
+
+    assert cache.get("token") is None
+
+def test_rotate_secret_flushes_cache(data, expires):
+    service = JWTTokenService(os.getenv("SECRET_KEY"), os.getenv("TOKEN_ALGORITHM"), VerifiedTokenCache())
+    token = service.encode(data, expires)
+    service.decode(token)
+
+    service.rotate_secret("ROTATED-SECRET")
+
+    with pytest.raises(DecodeTokenException):
+        service.decode(token)
+
+def test_rotate_secret_rejects_keyring_with_kids(data, expires):
+    keyring = JWTKeyring([JWTKey("key-1", "EdDSA", signing_key=generate_private_pem())])
+    service = JWTTokenService(keyring=keyring)
+    token = service.encode(data, expires)
+
+    with pytest.raises(ValueError):
+        service.rotate_secret("ROTATED-SECRET")
+    assert service.keyring is keyring
+    assert service.decode(token)["sub"] == data["sub"]
+
+def generate_private_pem() -> bytes:
+    return Ed25519PrivateKey.generate().private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+    )
+
+def public_pem(private_pem: bytes) -> bytes:
+    return serialization.load_pem_private_key(private_pem, None).public_key().public_bytes(
+        serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+    )
+
+def test_asymmetric_keyring_encode_and_verify_with_public_key(data, expires):
+    private_pem = generate_private_pem()
+    issuer = JWTTokenService(keyring=JWTKeyring([JWTKey("key-1", "EdDSA", signing_key=private_pem)]))
+    verifier = JWTTokenService(
+        keyring=JWTKeyring([JWTKey("key-1", "EdDSA", verification_key=public_pem(private_pem))])
+    )
+
+    token = issuer.encode(data, expires)
+
+    assert jwt.get_unverified_header(token)["kid"] == "key-1"
+    assert verifier.decode(token)["sub"] == data["sub"]
+    with pytest.raises(ValueError):
+        verifier.encode(data, expires)
+
+def test_keyring_rotation_and_retire(data, expires):
+    keyring = JWTKeyring([JWTKey("old", "EdDSA", signing_key=generate_private_pem())])
+    service = JWTTokenService(keyring=keyring, cache=VerifiedTokenCache())
+    old_token = service.encode(data, expires)
+
+    keyring.add(JWTKey("new", "EdDSA", signing_key=generate_private_pem()), activate=True)
+    new_token = service.encode(data, expires)
+
+    assert service.decode(old_token)["sub"] == data["sub"]
+    assert jwt.get_unverified_header(new_token)["kid"] == "new"
+
+    service.retire_key("old")
+
+    with pytest.raises(InvalidTokenException):
+        service.decode(old_token)
+    assert service.decode(new_token)["sub"] == data["sub"]
+
+def test_jwks_publishes_only_public_keys():
+    keyring = JWTKeyring([JWTKey("key-1", "EdDSA", signing_key=generate_private_pem())])
+    keyring.add(JWTKey("hmac", "HS256", signing_key="secret"))
+
+    jwks = keyring.jwks()
+
+    assert [jwk["kid"] for jwk in jwks["keys"]] == ["key-1"]
+    assert "d" not in jwks["keys"][0]
+    assert jwks["keys"][0]["alg"] == "EdDSA"
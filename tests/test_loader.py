@@ -0,0 +1,77 @@
+import asyncio
+import random
+from typing import Iterator
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.database.base_repository import BaseRepository
+from src.database.instrumentation import QueryInstrumentation, track_queries
+from src.database.loader import RepositoryLoader
+from src.exceptions import NotFoundRecord
+from tests.fixtures.session_settings import engine
+from tests.test_base_repository import PersonTestModel
+
+
+@pytest.fixture
+def instrumentation() -> Iterator[QueryInstrumentation]:
+    instrumentation = QueryInstrumentation()
+    instrumentation.attach(engine)
+    yield instrumentation
+    instrumentation.detach(engine)
+
+@pytest.fixture
+def repo(session: AsyncSession) -> BaseRepository[PersonTestModel]:
+    return BaseRepository(session, PersonTestModel)
+
+@pytest.fixture
+def loader(repo: BaseRepository) -> RepositoryLoader[PersonTestModel]:
+    return RepositoryLoader(repo)
+
+async def add_loaded_people(repo: BaseRepository, session: AsyncSession, amount: int) -> list:
+    people = await repo.bulk_create([{"name": "loader", "age": age} for age in range(amount)], returning=True)
+    await session.commit()
+    return people
+
+@pytest.mark.asyncio
+async def test_loads_in_same_tick_share_one_query(
+        repo: BaseRepository, session: AsyncSession, loader: RepositoryLoader, instrumentation: QueryInstrumentation
+):
+    people = await add_loaded_people(repo, session, 3)
+
+    with track_queries() as queries:
+        loaded = await asyncio.gather(*(loader.load(person.id) for person in people))
+        again = await loader.load(people[0].id)
+
+    assert queries.count == 1
+    assert [person.id for person in loaded] == [person.id for person in people]
+    assert again is loaded[0]
+
+@pytest.mark.asyncio
+async def test_missing_key_raises_not_found_only_for_that_key(
+        repo: BaseRepository, session: AsyncSession, loader: RepositoryLoader
+):
+    people = await add_loaded_people(repo, session, 1)
+    unknown_id = random.randint(99999, 999999999)
+
+    found, missing = await asyncio.gather(
+        loader.load(people[0].id), loader.load(unknown_id), return_exceptions=True
+    )
+
+    assert found.id == people[0].id
+    assert isinstance(missing, NotFoundRecord)
+    with pytest.raises(NotFoundRecord):
+        await loader.load(unknown_id)
+
+@pytest.mark.asyncio
+async def test_load_many_and_prime(
+        repo: BaseRepository, session: AsyncSession, loader: RepositoryLoader, instrumentation: QueryInstrumentation
+):
+    people = await add_loaded_people(repo, session, 2)
+    loader.prime(people[0])
+
+    with track_queries() as queries:
+        loaded = await loader.load_many([person.id for person in people])
+
+    assert loaded == people
+    assert queries.count == 1
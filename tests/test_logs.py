@@ -0,0 +1,66 @@
+import json
+import logging
+import os
+import uuid
+from typing import Iterator
+
+import pytest
+
+from src.config import LoggingSettings
+from src.logs import configure_logging, setup_logger, stop_logging
+
+
+@pytest.fixture(autouse=True)
+def reset_logging_settings() -> Iterator[None]:
+    yield
+    configure_logging(None)
+
+def isolated_logger_name() -> str:
+    name = f"test_logs_{uuid.uuid4().hex}"
+    logging.getLogger(name).propagate = False  # pytest's root handlers would short-circuit setup_logger
+    return name
+
+def test_queue_logger_writes_sampled_json_lines(tmp_path):
+    configure_logging(LoggingSettings(
+        log_dir=str(tmp_path), log_format="json", log_debug_sample_rate=0.0
+    ))
+    name = isolated_logger_name()
+    logger = setup_logger(name)
+
+    logger.info("hello")
+    logger.debug("dropped by sampling")
+    stop_logging()
+
+    lines = (tmp_path / f"{name}.log").read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["message"] for line in lines] == ["hello"]
+    assert json.loads(lines[0])["level"] == "INFO"
+
+def test_logs_dir_created_lazily(tmp_path):
+    logs_dir = tmp_path / "nested" / "logs"
+    configure_logging(LoggingSettings(log_dir=str(logs_dir), log_queue=False))
+
+    logger = setup_logger(isolated_logger_name())
+
+    assert not logs_dir.exists()
+
+    logger.debug("written synchronously")
+
+    assert logs_dir.exists()
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="needs fork")
+def test_forked_child_restarts_queue_listener(tmp_path):
+    configure_logging(LoggingSettings(log_dir=str(tmp_path), log_format="json"))
+    name = isolated_logger_name()
+    logger = setup_logger(name)
+
+    pid = os.fork()
+    if pid == 0:  # child
+        try:
+            logger.info("from child")
+            stop_logging()
+        finally:
+            os._exit(0)
+    os.waitpid(pid, 0)
+
+    lines = (tmp_path / f"{name}.log").read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["message"] for line in lines] == ["from child"]
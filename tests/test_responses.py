@@ -0,0 +1,24 @@
+import json
+
+from src.pagination import Pagination
+from src.responses import FastJSONResponse, dumps
+from tests.test_base_repository import PersonTestModel
+
+
+def test_to_dict_uses_all_columns():
+    person = PersonTestModel(id=1, name="test", age=10)
+
+    assert person.to_dict() == {"id": 1, "name": "test", "age": 10}
+
+def test_dumps_orm_records_and_rows():
+    payload = {"record": PersonTestModel(id=1, name="test", age=10), "row": {"id": 2}}
+
+    assert json.loads(dumps(payload)) == {"record": {"id": 1, "name": "test", "age": 10}, "row": {"id": 2}}
+
+def test_pagination_as_response():
+    page = Pagination(count=1, items=[PersonTestModel(id=1, name="test", age=10)])
+
+    response = page.as_response()
+
+    assert isinstance(response, FastJSONResponse)
+    assert json.loads(response.body) == {"count": 1, "items": [{"id": 1, "name": "test", "age": 10}]}
@@ -0,0 +1,41 @@
+import pytest
+
+from src.config import DataBaseSettings, ServerSettings
+from src.server import build_uvicorn_options, fit_workers_to_budget, worker_pool_size
+
+
+def test_development_mode_runs_single_reloading_process():
+    options = build_uvicorn_options(ServerSettings(server_mode="development", server_workers=8))
+
+    assert options["reload"] is True
+    assert "workers" not in options
+
+def test_production_mode_runs_configured_workers():
+    options = build_uvicorn_options(ServerSettings(
+        server_mode="production", server_workers=4, server_loop="uvloop", server_http="httptools"
+    ))
+
+    assert options["workers"] == 4
+    assert options["loop"] == "uvloop"
+    assert options["http"] == "httptools"
+    assert "reload" not in options
+
+def test_pool_budget_is_split_between_workers():
+    database_settings = DataBaseSettings(database_pool_budget=40)
+
+    assert worker_pool_size(database_settings, 4) == (10, 0)
+    assert worker_pool_size(DataBaseSettings(), 4) is None
+    with pytest.raises(ValueError):
+        worker_pool_size(database_settings, 64)
+
+def test_pool_budget_covers_replica_engines():
+    database_settings = DataBaseSettings(
+        database_pool_budget=40, database_replica_urls=["sqlite+aiosqlite:///replica.db"]
+    )
+
+    assert worker_pool_size(database_settings, 4) == (5, 0)
+    assert fit_workers_to_budget(database_settings, 64) == 20
+    assert fit_workers_to_budget(database_settings, 8) == 8
+    assert fit_workers_to_budget(DataBaseSettings(), 64) == 64
+    with pytest.raises(ValueError):
+        fit_workers_to_budget(DataBaseSettings(database_pool_budget=1, database_replica_urls=["a", "b"]), 1)
@@ -0,0 +1,69 @@
+import json
+
+import pytest
+from fastapi import FastAPI
+
+from benchmarks.asgi import asgi_request
+from src.database.base_repository import BaseRepository
+from src.streaming import csv_response, ndjson_response, stream_in_session
+from tests.fixtures.session_settings import SessionLocal
+from tests.test_base_repository import PersonTestModel
+
+
+async def records_of(*records):
+    for record in records:
+        yield record
+
+@pytest.fixture
+def app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/export")
+    async def export():
+        records = stream_in_session(
+            SessionLocal,
+            lambda session: BaseRepository(session, PersonTestModel).stream(
+                PersonTestModel.name == "export", batch_size=1
+            ),
+        )
+        return ndjson_response(records)
+
+    return app
+
+@pytest.mark.asyncio
+async def test_ndjson_response():
+    response = ndjson_response(records_of(PersonTestModel(id=1, name="test", age=10), {"id": 2}))
+
+    body = b"".join([chunk async for chunk in response.body_iterator])
+
+    assert response.media_type == "application/x-ndjson"
+    assert [json.loads(line) for line in body.splitlines()] == [
+        {"id": 1, "name": "test", "age": 10}, {"id": 2},
+    ]
+
+@pytest.mark.asyncio
+async def test_csv_response():
+    response = csv_response(
+        records_of(PersonTestModel(id=1, name="test", age=10), {"id": 2, "name": "row", "age": 20}),
+        fieldnames=["id", "name", "age"],
+        filename="people.csv",
+    )
+
+    body = b"".join([chunk async for chunk in response.body_iterator])
+
+    assert response.headers["content-disposition"] == 'attachment; filename="people.csv"'
+    assert body.decode().splitlines() == ["id,name,age", "1,test,10", "2,row,20"]
+
+@pytest.mark.asyncio
+async def test_stream_in_session_endpoint(app: FastAPI):
+    async with SessionLocal() as session:
+        await BaseRepository(session, PersonTestModel).bulk_create(
+            [{"name": "export", "age": age} for age in range(3)]
+        )
+        await session.commit()
+
+    status, headers, body = await asgi_request(app, "GET", "/export")
+
+    assert status == 200
+    assert headers["content-type"] == "application/x-ndjson"
+    assert [json.loads(line)["age"] for line in body.splitlines()] == [0, 1, 2]
@@ -0,0 +1,71 @@
+from typing import Iterator
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.celery_app import celery_app
+from src.database.base import Base
+from src.database.base_repository import BaseRepository
+from src.database.database import DatabaseHelper
+from src.tasks.database_task import DatabaseTask
+from src.tasks.task_batcher import TaskBatcher, flush_all
+from tests.test_base_repository import PersonTestModel
+
+
+@celery_app.task(base=DatabaseTask, bind=True)
+def create_people(self, rows: list) -> int:
+    async def run(session: AsyncSession) -> int:
+        await BaseRepository(session, PersonTestModel).bulk_create(rows)
+        return len(rows)
+
+    return self.run_in_session(run)
+
+def count_people(name: str) -> int:
+    return create_people.run_in_session(
+        lambda session: BaseRepository(session, PersonTestModel).count(PersonTestModel.name == name),
+        commit=False,
+    )
+
+@pytest.fixture
+def eager_tasks(tmp_path) -> Iterator[None]:
+    celery_app.conf.task_always_eager = True
+    DatabaseTask.use_database_helper(
+        DatabaseHelper(url=f"sqlite+aiosqlite:///{tmp_path / 'tasks.db'}", echo=False, profile="tests")
+    )
+
+    async def create_tables():
+        async with create_people.database_helper.engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+    create_people.run_async(create_tables())
+    yield
+    DatabaseTask.shutdown()
+    celery_app.conf.task_always_eager = False
+
+def test_database_task_reuses_worker_helper(eager_tasks):
+    first = create_people.delay([{"name": "task", "age": 1}]).get()
+    second = create_people.delay([{"name": "task", "age": 2}]).get()
+
+    assert first == second == 1
+    assert count_people("task") == 2
+    assert create_people.database_helper is DatabaseTask._database_helper
+
+def test_batcher_sends_one_task_per_batch(eager_tasks):
+    batcher = TaskBatcher(create_people, max_size=3, max_delay=60)
+
+    results = [batcher.add({"name": "batched", "age": age}) for age in range(7)]
+    last = batcher.flush()
+
+    assert [result.get() for result in results if result is not None] == [3, 3]
+    assert last.get() == 1
+    assert count_people("batched") == 7
+    assert batcher.flush() is None
+
+def test_flush_all_sends_pending_batches(eager_tasks):
+    batcher = TaskBatcher(create_people, max_size=100, max_delay=60)
+    batcher.add({"name": "shutdown", "age": 1})
+
+    flush_all()
+
+    assert count_people("shutdown") == 1
+    assert batcher.flush() is None
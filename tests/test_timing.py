@@ -0,0 +1,54 @@
+import pytest
+from fastapi import FastAPI
+
+from benchmarks.asgi import asgi_request
+from src.main import app as main_app
+from src.timing import RequestMetrics, TimingMiddleware, timed
+
+
+@pytest.fixture
+def metrics() -> RequestMetrics:
+    return RequestMetrics()
+
+@pytest.fixture
+def app(metrics: RequestMetrics) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(TimingMiddleware, metrics=metrics)
+
+    @timed("token")
+    def decode_token() -> dict:
+        return {"sub": "123"}
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int):
+        return {"id": item_id, **decode_token()}
+
+    return app
+
+@pytest.mark.asyncio
+async def test_server_timing_header_breaks_down_components(app: FastAPI):
+    status, headers, _ = await asgi_request(app, "GET", "/items/1")
+
+    assert status == 200
+    assert "token;dur=" in headers["server-timing"]
+    assert "total;dur=" in headers["server-timing"]
+
+@pytest.mark.asyncio
+async def test_metrics_grouped_by_route_template(app: FastAPI, metrics: RequestMetrics):
+    await asgi_request(app, "GET", "/items/1")
+    await asgi_request(app, "GET", "/items/2")
+    await asgi_request(app, "GET", "/missing")
+
+    assert metrics.latency[("GET", "/items/{item_id}")].count == 2
+    assert metrics.responses[("GET", "unmatched", 404)] == 1
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint_exposes_prometheus_text():
+    async with main_app.router.lifespan_context(main_app):
+        await asgi_request(main_app, "GET", "/metrics")
+        status, headers, body = await asgi_request(main_app, "GET", "/metrics")
+
+    assert status == 200
+    assert headers["content-type"].startswith("text/plain")
+    assert b'http_request_duration_seconds_count{method="GET",route="/metrics"}' in body
+    assert b"db_slow_queries_total" in body
@@ -0,0 +1,105 @@
+import asyncio
+import time
+from datetime import timedelta
+
+import pytest
+
+from src.api.auth.exceptions import InvalidTokenException, RevokedTokenException
+from src.api.auth.utils.token.memory_revocation_index import MemoryRevocationIndex
+from src.api.auth.utils.token.token_pair_service import TokenPairService
+
+
+class NetworkRevocationIndex(MemoryRevocationIndex):
+    """Yields to the loop on every call, like a round trip to Redis."""
+
+    async def revoke_once(self, jti: str, expires_at: int) -> bool:
+        await asyncio.sleep(0)
+        return await super().revoke_once(jti, expires_at)
+
+    async def is_revoked(self, jti: str) -> bool:
+        revoked = await super().is_revoked(jti)
+        await asyncio.sleep(0)
+        return revoked
+
+
+@pytest.fixture
+def token_pair_service(jwt_service) -> TokenPairService:
+    return TokenPairService(
+        jwt_service,
+        MemoryRevocationIndex(),
+        access_expires=timedelta(minutes=5),
+        refresh_expires=timedelta(minutes=30),
+    )
+
+@pytest.fixture
+def data() -> dict:
+    return {"sub": "123"}
+
+@pytest.mark.asyncio
+async def test_issue_and_verify_access(token_pair_service: TokenPairService, data):
+    pair = token_pair_service.issue(data)
+
+    claims = await token_pair_service.verify_access(pair.access_token)
+
+    assert claims["sub"] == data["sub"]
+    assert claims["type"] == "access"
+
+@pytest.mark.asyncio
+async def test_refresh_token_is_not_access_token(token_pair_service: TokenPairService, data):
+    pair = token_pair_service.issue(data)
+
+    with pytest.raises(InvalidTokenException):
+        await token_pair_service.verify_access(pair.refresh_token)
+
+@pytest.mark.asyncio
+async def test_refresh_rotates_and_revokes_old_token(token_pair_service: TokenPairService, data):
+    pair = token_pair_service.issue(data)
+
+    new_pair = await token_pair_service.refresh(pair.refresh_token)
+
+    assert (await token_pair_service.verify_access(new_pair.access_token))["sub"] == data["sub"]
+    with pytest.raises(RevokedTokenException):
+        await token_pair_service.refresh(pair.refresh_token)
+
+@pytest.mark.asyncio
+async def test_revoke_access_token(token_pair_service: TokenPairService, data):
+    pair = token_pair_service.issue(data)
+
+    await token_pair_service.revoke(pair.access_token)
+
+    with pytest.raises(RevokedTokenException):
+        await token_pair_service.verify_access(pair.access_token)
+
+@pytest.mark.asyncio
+async def test_concurrent_refresh_with_same_token_succeeds_once(jwt_service, data):
+    service = TokenPairService(
+        jwt_service,
+        NetworkRevocationIndex(),
+        access_expires=timedelta(minutes=5),
+        refresh_expires=timedelta(minutes=30),
+    )
+    pair = service.issue(data)
+
+    results = await asyncio.gather(
+        service.refresh(pair.refresh_token), service.refresh(pair.refresh_token), return_exceptions=True
+    )
+
+    assert sum(isinstance(result, RevokedTokenException) for result in results) == 1
+
+@pytest.mark.asyncio
+async def test_memory_revocation_index_prunes_expired_entries():
+    index = MemoryRevocationIndex()
+    now = int(time.time())
+    await index.revoke("expired", now - 1)
+    await index.revoke("live", now + 60)
+
+    assert await index.revoke_once("live", now + 60) is False
+    assert await index.revoke_once("fresh", now + 60) is True
+    assert set(index._revoked) == {"live", "fresh"}
+
+@pytest.mark.asyncio
+async def test_revoke_token_without_jti_is_invalid(token_pair_service: TokenPairService, jwt_service, data):
+    token = jwt_service.encode(data, expires_in=timedelta(minutes=5))
+
+    with pytest.raises(InvalidTokenException):
+        await token_pair_service.revoke(token)